@@ -3,81 +3,173 @@
 Telegram bot for checking GolemSP status.
 """
 
+from __future__ import annotations
+
 import os
+import re
+import html
+import signal
 import stat
-import subprocess
-import shutil
 import logging
+import logging.handlers
+import queue
 import json
 import asyncio
+import atexit
+import time
+from functools import lru_cache
 from datetime import datetime, timedelta
-from telegram import Update, ReplyKeyboardMarkup, KeyboardButton
-from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
+from typing import TYPE_CHECKING
 from dotenv import load_dotenv
+
+# orjson is faster for state persistence; fall back to the stdlib if missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Load environment variables before the platform modules read their settings
+load_dotenv()
+
 from platforms.render_network import check_render_status, parse_render_status, format_render_status
 from platforms.ai_training import check_ai_training_status, parse_ai_training_status, format_ai_training_status
 
-# Load environment variables
-load_dotenv()
+# python-telegram-bot is imported lazily in main() to keep imports cheap
+if TYPE_CHECKING:
+    from telegram import Update
+    from telegram.ext import ContextTypes
 
-# Configure logging
-logging.basicConfig(
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    level=logging.INFO
-)
 logger = logging.getLogger(__name__)
 
 BOT_TOKEN = os.getenv('BOT_TOKEN')
 
-if not BOT_TOKEN:
-    raise ValueError("BOT_TOKEN environment variable is not set. Please set it in .env file or environment.")
-
 # Configuration for monitoring
 MONITORING_ENABLED = os.getenv('MONITORING_ENABLED', 'true').lower() == 'true'
 MONITORING_INTERVAL = int(os.getenv('MONITORING_INTERVAL', '300'))  # 5 minutes default
+# Upper bound for the interval while nothing changes (doubles per idle check)
+MONITORING_MAX_INTERVAL = int(os.getenv('MONITORING_MAX_INTERVAL', '3600'))
+NOTIFICATION_CONCURRENCY = 25  # Max notification sends in flight at once
 STATE_FILE = os.path.join(os.path.dirname(__file__), 'bot_state.json')
 USERS_FILE = os.path.join(os.path.dirname(__file__), 'registered_users.json')
+USERS_SAVE_DELAY = 5  # Seconds to batch registration changes into one write
+# Render / AI Training state fields compared between monitoring checks
+PLATFORM_STATE_DEFAULTS = {'total_earnings': 0.0, 'active_jobs': 0}
+OFFSET_FILE = os.path.join(os.path.dirname(__file__), 'update_offset.json')
+OFFSET_SAVE_DELAY = 5  # Seconds to batch update offset changes into one write
 
 # Platform configuration
 RENDER_NETWORK_ENABLED = os.getenv('RENDER_NETWORK_ENABLED', 'false').lower() == 'true'
 AI_TRAINING_ENABLED = os.getenv('AI_TRAINING_ENABLED', 'false').lower() == 'true'
 
+# How long a golemsp status result is reused for bursty requests (seconds)
+STATUS_CACHE_TTL = float(os.getenv('STATUS_CACHE_TTL', '2'))
+
+# Persistent reply keyboard layout; the markup is built once in main()
+REPLY_KEYBOARD_LAYOUT = [
+    ["📊 Service Status", "💰 Wallet Info"],
+    ["⚡ Task Statistics"],
+    # Always show platform buttons, even if not enabled
+    ["🎨 Render Status", "🤖 AI Training Status"],
+    ["🌐 All Platforms"],
+]
+REPLY_KEYBOARD = None
+
 # Global variables for monitoring
 monitoring_task = None
+monitoring_stop_event = None  # Set to stop the monitoring loop
+monitoring_wake_event = None  # Set to run the next monitoring check right away
+monitoring_restart_handle = None  # Pending relaunch after a crash
+last_monitored_output = None  # Raw golemsp output from the last monitoring check
 last_status_data = None
-registered_users = set()  # Store chat IDs of users who want notifications
+registered_users = {}  # Chat IDs of users who want notifications (dict keys keep order)
+users_save_handle = None  # Pending batched save of registered_users
+last_saved_state = None  # State last written to STATE_FILE, without timestamps
+last_update_id = None  # Newest update handled, persisted to OFFSET_FILE
+notifications_resume_at = 0.0  # time.monotonic() before which sends wait (flood control)
+offset_save_handle = None  # Pending batched save of last_update_id
+
+# Common golemsp install locations checked after PATH
+COMMON_GOLEMSP_PATHS = [
+    '/usr/local/bin/golemsp',
+    '/usr/bin/golemsp',
+    '/opt/golemsp/bin/golemsp',
+    os.path.expanduser('~/.local/bin/golemsp'),
+]
+
+# Owner, group, or others execute permission
+EXEC_PERMISSION_BITS = stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+
+# How long a resolved golemsp path and permission check are trusted (seconds)
+GOLEMSP_LOOKUP_TTL = 3600
+# -inf means "never checked"; time.monotonic() may be smaller than the TTL
+_golemsp_lookup = {'checked_at': float('-inf')}
+
+# "Last updated" text for the most recent second it was formatted in
+_timestamp_cache = {'second': None, 'text': ''}
+
+# Parsed data and rendered messages for the latest golemsp status run
+status_snapshot = {'output': None, 'data': None, 'messages': {}}
 
+# Short-lived cache of the last golemsp status result
+_status_cache = {'ts': float('-inf'), 'result': None}
+_status_lock = asyncio.Lock()
 
+
+def _is_executable_file(path):
+    """
+    Check whether path is a regular file with an execute bit set.
+
+    Uses a single stat call instead of separate isfile/access probes.
+
+    Args:
+        path: Filesystem path to probe
+
+    Returns:
+        bool: True if path is an executable regular file
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
+        return False
+    return stat.S_ISREG(mode) and bool(mode & EXEC_PERMISSION_BITS)
+
+
+@lru_cache(maxsize=1)
 def find_golemsp_binary():
     """
     Find the golemsp binary location.
+
+    The result is cached for the lifetime of the process; call
+    ``find_golemsp_binary.cache_clear()`` to force a new lookup.
     
     Returns:
         str or None: Path to golemsp binary, or None if not found
     """
-    # Try using shutil.which first
-    golemsp_path = shutil.which('golemsp')
-    if golemsp_path:
-        return golemsp_path
-    
-    # Try common locations
-    common_paths = [
-        '/usr/local/bin/golemsp',
-        '/usr/bin/golemsp',
-        '/opt/golemsp/bin/golemsp',
-        os.path.expanduser('~/.local/bin/golemsp'),
-    ]
-    
-    for path in common_paths:
-        if os.path.isfile(path) and os.access(path, os.X_OK):
+    # Try PATH first, then common locations
+    path_dirs = [d for d in os.environ.get('PATH', os.defpath).split(os.pathsep) if d]
+    candidates = [os.path.join(d, 'golemsp') for d in path_dirs]
+    candidates += COMMON_GOLEMSP_PATHS
+
+    # Probe each candidate once with a single stat; common locations that
+    # are already on PATH are not checked twice
+    seen = set()
+    for path in candidates:
+        if path in seen:
+            continue
+        seen.add(path)
+        if _is_executable_file(path):
             return path
     
     return None
 
 
+@lru_cache(maxsize=4)
 def check_golemsp_permissions(golemsp_path):
     """
     Check if golemsp binary has execute permissions.
+
+    Results are cached per path; send SIGHUP to the bot to re-check after
+    fixing permissions (e.g. ``chmod +x``).
     
     Args:
         golemsp_path: Path to golemsp binary
@@ -88,36 +180,170 @@ def check_golemsp_permissions(golemsp_path):
     if not golemsp_path:
         return False, "golemsp binary not found"
     
-    if not os.path.exists(golemsp_path):
-        return False, f"golemsp binary not found at {golemsp_path}"
-    
-    if not os.access(golemsp_path, os.X_OK):
-        # Check file permissions
+    # A single stat call provides everything os.path.exists/os.access would
+    try:
         file_stat = os.stat(golemsp_path)
-        mode = file_stat.st_mode
-        
-        # Check if it's executable by owner, group, or others
-        is_executable = bool(
-            mode & stat.S_IXUSR or  # Owner execute
-            mode & stat.S_IXGRP or  # Group execute
-            mode & stat.S_IXOTH     # Others execute
+    except FileNotFoundError:
+        return False, f"golemsp binary not found at {golemsp_path}"
+    except OSError as e:
+        return False, f"Cannot access golemsp binary at {golemsp_path}: {e}"
+    mode = file_stat.st_mode
+
+    # Check if it's executable by owner, group, or others
+    is_executable = bool(mode & EXEC_PERMISSION_BITS)
+
+    if not is_executable:
+        return False, (
+            f"golemsp binary at {golemsp_path} does not have execute permissions. "
+            f"Run: chmod +x {golemsp_path}"
         )
-        
-        if not is_executable:
-            return False, (
-                f"golemsp binary at {golemsp_path} does not have execute permissions. "
-                f"Run: chmod +x {golemsp_path}"
-            )
-        else:
-            return False, (
-                f"Permission denied executing {golemsp_path}. "
-                f"Current user may not have permission. Check file ownership and permissions."
-            )
-    
+
+    # Pick the execute bit that applies to the current user (root only
+    # needs any execute bit, which is already established above)
+    euid = os.geteuid()
+    if euid == 0:
+        user_exec_bit = mode & EXEC_PERMISSION_BITS
+    elif file_stat.st_uid == euid:
+        user_exec_bit = mode & stat.S_IXUSR
+    elif file_stat.st_gid == os.getegid() or file_stat.st_gid in os.getgroups():
+        user_exec_bit = mode & stat.S_IXGRP
+    else:
+        user_exec_bit = mode & stat.S_IXOTH
+
+    if not user_exec_bit:
+        return False, (
+            f"Permission denied executing {golemsp_path}. "
+            f"Current user may not have permission. Check file ownership and permissions."
+        )
+
     return True, None
 
 
-def run_golemsp_status():
+def setup_logging():
+    """
+    Configure root logging for the bot process.
+
+    Records are put on a queue and written to stderr by a background
+    listener thread, so handlers never block on log output.
+
+    Called from main() so importing this module has no logging side effects.
+
+    Returns:
+        QueueListener: Started listener, stopped automatically at exit
+    """
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    )
+
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    root_logger = logging.getLogger()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(logging.INFO)
+    listener.start()
+    # Flush queued records on exit, including SystemExit before polling starts
+    atexit.register(listener.stop)
+    return listener
+
+
+def clear_golemsp_caches():
+    """
+    Clear cached golemsp binary lookup and permission check results.
+
+    Installed as the event loop's SIGHUP handler in on_startup().
+    """
+    find_golemsp_binary.cache_clear()
+    check_golemsp_permissions.cache_clear()
+    logger.info("Cleared cached golemsp binary lookup and permission checks")
+
+
+def get_golemsp_binary():
+    """
+    Return the golemsp binary path, re-resolving it every GOLEMSP_LOOKUP_TTL seconds.
+
+    Returns:
+        str or None: Path to golemsp binary, or None if not found
+    """
+    now = time.monotonic()
+    if now - _golemsp_lookup['checked_at'] >= GOLEMSP_LOOKUP_TTL:
+        find_golemsp_binary.cache_clear()
+        check_golemsp_permissions.cache_clear()
+        _golemsp_lookup['checked_at'] = now
+    return find_golemsp_binary()
+
+
+def invalidate_golemsp_lookup():
+    """Force the next get_golemsp_binary() call to look the binary up again."""
+    _golemsp_lookup['checked_at'] = float('-inf')
+
+
+def golemsp_status_is_fresh():
+    """Return True if run_golemsp_status() would answer from its cache."""
+    return time.monotonic() - _status_cache['ts'] < STATUS_CACHE_TTL
+
+
+async def run_golemsp_status():
+    """
+    Return 'golemsp status' output, reusing a recent result if available.
+
+    Results are cached for STATUS_CACHE_TTL seconds and concurrent callers
+    share a single subprocess run.
+
+    Returns:
+        tuple: (success: bool, output: str, error: str)
+    """
+    if golemsp_status_is_fresh():
+        return _status_cache['result']
+
+    async with _status_lock:
+        # Another caller may have refreshed the cache while we waited
+        if golemsp_status_is_fresh():
+            return _status_cache['result']
+
+        result = await _execute_golemsp_status()
+        _status_cache['result'] = result
+        _status_cache['ts'] = time.monotonic()
+        return result
+
+
+def decode_output(data):
+    """
+    Decode subprocess output the way subprocess.run(text=True) would.
+
+    Args:
+        data: Raw bytes from the process
+
+    Returns:
+        str: Decoded text with CRLF and CR line endings converted to LF
+    """
+    return data.decode(errors='replace').replace('\r\n', '\n').replace('\r', '\n')
+
+
+async def stop_process(proc):
+    """
+    Terminate a subprocess, escalating to kill, and wait for it to exit.
+
+    The process may exit on its own at any point, but it is always reaped.
+
+    Args:
+        proc: asyncio subprocess to stop
+    """
+    try:
+        proc.terminate()
+    except ProcessLookupError:
+        pass
+    try:
+        await asyncio.wait_for(proc.wait(), timeout=5)
+    except asyncio.TimeoutError:
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+        await proc.wait()
+
+
+async def _execute_golemsp_status():
     """
     Execute 'golemsp status' command and return the output.
     
@@ -125,9 +351,11 @@ def run_golemsp_status():
         tuple: (success: bool, output: str, error: str)
     """
     # Find golemsp binary
-    golemsp_path = find_golemsp_binary()
+    golemsp_path = get_golemsp_binary()
     
     if not golemsp_path:
+        # Don't keep trusting a miss; GolemSP may be installed later
+        invalidate_golemsp_lookup()
         return False, None, (
             "golemsp command not found. Please ensure GolemSP is installed and in PATH, "
             "or update the docker-compose.yml volume mount path."
@@ -136,36 +364,62 @@ def run_golemsp_status():
     # Check permissions
     has_permission, perm_error = check_golemsp_permissions(golemsp_path)
     if not has_permission:
+        # Re-check next time so a fix like chmod +x is picked up right away
+        invalidate_golemsp_lookup()
         return False, None, perm_error
     
     try:
-        # Use the full path to golemsp
-        result = subprocess.run(
-            [golemsp_path, 'status'],
-            capture_output=True,
-            text=True,
-            timeout=30
+        # Use the full path to golemsp; run it without blocking the event loop
+        proc = await asyncio.create_subprocess_exec(
+            golemsp_path, 'status',
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
         )
-        
-        if result.returncode == 0:
-            return True, result.stdout, None
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+        except asyncio.TimeoutError:
+            return False, None, "Command timed out after 30 seconds."
+        finally:
+            # Reap golemsp on timeout and also when this task is cancelled
+            if proc.returncode is None:
+                await stop_process(proc)
+
+        if proc.returncode == 0:
+            return True, decode_output(stdout), None
         else:
-            return False, None, result.stderr or "Command failed with non-zero exit code"
+            return False, None, decode_output(stderr) or "Command failed with non-zero exit code"
     
     except PermissionError as e:
+        invalidate_golemsp_lookup()
         return False, None, (
             f"Permission denied executing golemsp: {str(e)}\n"
             f"Binary location: {golemsp_path}\n"
             f"Try: chmod +x {golemsp_path} or check file ownership."
         )
     except FileNotFoundError:
+        invalidate_golemsp_lookup()
         return False, None, f"golemsp binary not found at {golemsp_path}"
-    except subprocess.TimeoutExpired:
-        return False, None, "Command timed out after 30 seconds."
     except Exception as e:
         return False, None, f"Error executing command: {str(e)}"
 
 
+def read_json(path):
+    """
+    Read JSON data from path.
+
+    Args:
+        path: File path to read
+
+    Returns:
+        Decoded JSON data
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
 def load_previous_state():
     """
     Load the previous bot state from file.
@@ -175,24 +429,56 @@ def load_previous_state():
     """
     try:
         if os.path.exists(STATE_FILE):
-            with open(STATE_FILE, 'r') as f:
-                return json.load(f)
+            return read_json(STATE_FILE)
     except Exception as e:
         logger.error(f"Error loading state file: {e}")
 
     return {}
 
 
+def write_json_atomic(path, data):
+    """
+    Write data as JSON to path atomically.
+
+    The data is written to a temporary file first and then renamed over the
+    target, so readers never see a partially written file.
+
+    Args:
+        path: Destination file path
+        data: JSON-serializable data
+    """
+    tmp_path = f"{path}.tmp"
+    if orjson is not None:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
 def save_current_state(state_data):
     """
     Save the current bot state to file.
 
+    The file is only rewritten when the state differs from what was last
+    saved, ignoring the per-check timestamps.
+
     Args:
         state_data: Dictionary containing current state
     """
+    global last_saved_state
+
+    comparable_state = {
+        key: {k: v for k, v in value.items() if k != 'timestamp'}
+        for key, value in state_data.items()
+    }
+    if comparable_state == last_saved_state:
+        return
+
     try:
-        with open(STATE_FILE, 'w') as f:
-            json.dump(state_data, f, indent=2)
+        write_json_atomic(STATE_FILE, state_data)
+        last_saved_state = comparable_state
     except Exception as e:
         logger.error(f"Error saving state file: {e}")
 
@@ -202,17 +488,16 @@ def load_registered_users():
     Load registered users from file.
 
     Returns:
-        set: Set of registered chat IDs
+        dict: Registered chat IDs as keys, in registration order
     """
     global registered_users
     try:
         if os.path.exists(USERS_FILE):
-            with open(USERS_FILE, 'r') as f:
-                user_list = json.load(f)
-                registered_users = set(user_list)
+            user_list = read_json(USERS_FILE)
+            registered_users = dict.fromkeys(user_list)
     except Exception as e:
         logger.error(f"Error loading users file: {e}")
-        registered_users = set()
+        registered_users = {}
 
     return registered_users
 
@@ -221,13 +506,46 @@ def save_registered_users():
     """
     Save registered users to file.
     """
+    global users_save_handle
+
+    # Any pending batched save is covered by this one
+    if users_save_handle is not None:
+        users_save_handle.cancel()
+        users_save_handle = None
+
     try:
-        with open(USERS_FILE, 'w') as f:
-            json.dump(list(registered_users), f, indent=2)
+        write_json_atomic(USERS_FILE, list(registered_users))
     except Exception as e:
         logger.error(f"Error saving users file: {e}")
 
 
+def schedule_save_registered_users():
+    """
+    Save registered users after USERS_SAVE_DELAY seconds.
+
+    Changes made in quick succession are batched into a single write. Outside
+    of a running event loop the users are saved immediately.
+    """
+    global users_save_handle
+
+    if users_save_handle is not None:
+        return
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        save_registered_users()
+        return
+
+    users_save_handle = loop.call_later(USERS_SAVE_DELAY, save_registered_users)
+
+
+def flush_registered_users():
+    """Write a pending batched save of registered users immediately."""
+    if users_save_handle is not None:
+        save_registered_users()
+
+
 def register_user(chat_id):
     """
     Register a user for notifications.
@@ -235,8 +553,9 @@ def register_user(chat_id):
     Args:
         chat_id: Telegram chat ID to register
     """
-    registered_users.add(chat_id)
-    save_registered_users()
+    if chat_id not in registered_users:
+        registered_users[chat_id] = None
+        schedule_save_registered_users()
     logger.info(f"User {chat_id} registered for notifications")
 
 
@@ -247,15 +566,152 @@ def unregister_user(chat_id):
     Args:
         chat_id: Telegram chat ID to unregister
     """
-    registered_users.discard(chat_id)
-    save_registered_users()
+    if chat_id in registered_users:
+        del registered_users[chat_id]
+        schedule_save_registered_users()
     logger.info(f"User {chat_id} unregistered from notifications")
 
 
+def load_update_offset():
+    """
+    Load the id of the last update handled before the previous shutdown.
+
+    Returns:
+        int or None: Last handled update id, if one was saved
+    """
+    try:
+        if os.path.exists(OFFSET_FILE):
+            return read_json(OFFSET_FILE).get('update_id')
+    except Exception as e:
+        logger.error(f"Error loading update offset file: {e}")
+    return None
+
+
+def save_update_offset():
+    """
+    Save the id of the last handled update to file.
+    """
+    global offset_save_handle
+
+    if offset_save_handle is not None:
+        offset_save_handle.cancel()
+        offset_save_handle = None
+
+    try:
+        write_json_atomic(OFFSET_FILE, {'update_id': last_update_id})
+    except Exception as e:
+        logger.error(f"Error saving update offset file: {e}")
+
+
+def flush_update_offset():
+    """Write a pending batched save of the update offset immediately."""
+    if offset_save_handle is not None:
+        save_update_offset()
+
+
+async def record_update_offset(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """
+    Remember the newest update id and schedule a batched save of it.
+
+    Registered in a handler group after the regular handlers, so an update
+    is only recorded once its handler has finished (or raised). An update
+    interrupted by a crash is therefore delivered again after a restart.
+    """
+    global last_update_id, offset_save_handle
+
+    if last_update_id is not None and update.update_id <= last_update_id:
+        return
+    last_update_id = update.update_id
+
+    if offset_save_handle is None:
+        offset_save_handle = asyncio.get_running_loop().call_later(
+            OFFSET_SAVE_DELAY, save_update_offset
+        )
+
+
+async def skip_handled_updates(application):
+    """
+    Confirm updates handled before the last shutdown so they are not redelivered.
+
+    Telegram treats every update below the requested offset as confirmed, so
+    one getUpdates call with the saved offset makes polling resume after it.
+    """
+    global last_update_id
+
+    saved_update_id = load_update_offset()
+    if saved_update_id is None:
+        return
+
+    last_update_id = saved_update_id
+    try:
+        await application.bot.get_updates(offset=saved_update_id + 1, limit=1, timeout=0)
+        logger.info(f"Resuming updates after update id {saved_update_id}")
+    except Exception as e:
+        logger.warning(f"Could not confirm previously handled updates: {e}")
+
+
+def parse_glm_amount(field, value):
+    """
+    Parse a GLM amount like "123.456 GLM (0)" into display and numeric fields.
+
+    Args:
+        field: Key to store the raw value under; the float goes to "<field>_glm"
+        value: Value text from golemsp status output
+
+    Returns:
+        dict: Parsed wallet fields
+    """
+    fields = {field: value}
+    try:
+        fields[f'{field}_glm'] = float(value.split()[0])
+    except (ValueError, IndexError):
+        pass
+    return fields
+
+
+def parse_task_count(field, value):
+    """Parse a task counter, ignoring values that are not integers."""
+    try:
+        return {field: int(value)}
+    except ValueError:
+        return {}
+
+
+# Known golemsp status fields: key -> (section, function turning the value
+# text into the fields to store in that section)
+GOLEM_STATUS_FIELDS = {
+    'Service': ('service', lambda v: {'status': 'running'} if 'running' in v else {}),
+    'Version': ('service', lambda v: {'version': v} if any(c.isdigit() for c in v) else {}),
+    'Node Name': ('service', lambda v: {'node_name': v}),
+    'Subnet': ('service', lambda v: {'subnet': v}),
+    'VM': ('service', lambda v: {'vm': 'invalid environment'} if 'invalid environment' in v else {}),
+    'network': ('wallet', lambda v: {'network': 'mainnet'} if 'mainnet' in v else {}),
+    'amount (total)': ('wallet', lambda v: parse_glm_amount('total', v) if 'GLM' in v else {'total': v}),
+    'pending': ('wallet', lambda v: parse_glm_amount('pending', v) if 'GLM' in v else {}),
+    'last 1h processed': ('tasks', lambda v: parse_task_count('last_hour_processed', v)),
+    'last 1h in progress': ('tasks', lambda v: parse_task_count('in_progress', v)),
+    'total processed': ('tasks', lambda v: parse_task_count('total_processed', v)),
+}
+
+# One "<key>  <value>" field (or the wallet address) of golemsp status output,
+# matched on lines with the box borders already removed
+STATUS_FIELD_RE = re.compile(
+    r'^[ \t]*(?:'
+    r'(?P<address>0x\S{9,})'
+    r'|(?P<key>' + '|'.join(re.escape(key) for key in GOLEM_STATUS_FIELDS) + r')'
+    r'[ \t]+(?P<value>[^\n]*?)'
+    r')[ \t]*$',
+    re.MULTILINE
+)
+
+
 def parse_status_data(status_output):
     """
     Parse the golemsp status output and extract detailed information.
 
+    This is the single parser for golemsp output; formatters and change
+    detection all work from its result.
+
     Args:
         status_output: Raw output from golemsp status command
 
@@ -265,7 +721,6 @@ def parse_status_data(status_output):
     if not status_output:
         return {}
 
-    lines = status_output.strip().split('\n')
     data = {
         'timestamp': datetime.now().isoformat(),
         'service': {},
@@ -273,81 +728,55 @@ def parse_status_data(status_output):
         'tasks': {}
     }
 
-    current_section = None
-
-    for line in lines:
-        cleaned_line = line.replace('│', '').strip()
-        if not cleaned_line:
+    # Drop the box borders once, then scan the whole output in one pass
+    for match in STATUS_FIELD_RE.finditer(status_output.replace('│', '')):
+        address = match.group('address')
+        if address:
+            data['wallet']['address'] = address
             continue
 
-        # Detect sections
-        if 'Status' in cleaned_line and ('─' in line or 'Status' in cleaned_line):
-            current_section = 'status'
-            continue
-        elif 'Wallet' in cleaned_line and ('─' in line or 'Wallet' in cleaned_line):
-            current_section = 'wallet'
-            continue
-        elif 'Tasks' in cleaned_line and ('─' in line or 'Tasks' in cleaned_line):
-            current_section = 'tasks'
-            continue
+        section, parse_value = GOLEM_STATUS_FIELDS[match.group('key')]
+        data[section].update(parse_value(match.group('value')))
 
-        # Skip separator lines
-        if any(char in line for char in ['─', '┌', '└', '├', '┤', '┐', '┘']):
-            continue
+    return data
 
-        # Parse status section
-        if current_section == 'status':
-            if 'Service' in cleaned_line and 'running' in cleaned_line:
-                data['service']['status'] = 'running'
-            elif 'Version' in cleaned_line and any(char.isdigit() for char in cleaned_line):
-                data['service']['version'] = cleaned_line.split('Version')[-1].strip()
-            elif 'Node Name' in cleaned_line:
-                data['service']['node_name'] = cleaned_line.split('Node Name')[-1].strip()
-            elif 'Subnet' in cleaned_line:
-                data['service']['subnet'] = cleaned_line.split('Subnet')[-1].strip()
-
-        # Parse wallet section
-        elif current_section == 'wallet':
-            if cleaned_line.startswith('0x') and len(cleaned_line) > 10:
-                data['wallet']['address'] = cleaned_line
-            elif 'amount (total)' in cleaned_line:
-                # Extract GLM amount from line like "amount (total): 123.456 GLM"
-                amount_part = cleaned_line.split('amount (total)')[-1].strip()
-                if 'GLM' in amount_part:
-                    try:
-                        amount = float(amount_part.split()[0])
-                        data['wallet']['total_glm'] = amount
-                    except (ValueError, IndexError):
-                        pass
-            elif cleaned_line.startswith('pending') and 'GLM' in cleaned_line:
-                try:
-                    amount = float(cleaned_line.split()[1])
-                    data['wallet']['pending_glm'] = amount
-                except (ValueError, IndexError):
-                    pass
-
-        # Parse tasks section
-        elif current_section == 'tasks':
-            if 'last 1h processed' in cleaned_line:
-                try:
-                    count = int(cleaned_line.split('last 1h processed')[-1].strip())
-                    data['tasks']['last_hour_processed'] = count
-                except (ValueError, IndexError):
-                    pass
-            elif 'last 1h in progress' in cleaned_line:
-                try:
-                    count = int(cleaned_line.split('last 1h in progress')[-1].strip())
-                    data['tasks']['in_progress'] = count
-                except (ValueError, IndexError):
-                    pass
-            elif 'total processed' in cleaned_line:
-                try:
-                    count = int(cleaned_line.split('total processed')[-1].strip())
-                    data['tasks']['total_processed'] = count
-                except (ValueError, IndexError):
-                    pass
 
-    return data
+def get_status_data(status_output):
+    """
+    Return parsed data for golemsp output, parsing each status run only once.
+
+    The cache is keyed on the output object itself, so every new golemsp run
+    (even with identical text) gets fresh data and timestamps.
+
+    Args:
+        status_output: Raw output from run_golemsp_status()
+
+    Returns:
+        dict: Parsed status data
+    """
+    if status_snapshot['output'] is not status_output:
+        status_snapshot['output'] = status_output
+        status_snapshot['data'] = parse_status_data(status_output)
+        status_snapshot['messages'] = {}
+    return status_snapshot['data']
+
+
+def render_golem_status(status_output, formatter):
+    """
+    Format golemsp output, reusing messages already rendered for the same run.
+
+    Args:
+        status_output: Raw output from run_golemsp_status()
+        formatter: Function turning parsed status data into a message
+
+    Returns:
+        str: Formatted message
+    """
+    status_data = get_status_data(status_output)
+    messages = status_snapshot['messages']
+    if formatter not in messages:
+        messages[formatter] = formatter(status_data)
+    return messages[formatter]
 
 
 def detect_changes(current_data, previous_data):
@@ -394,278 +823,194 @@ def detect_changes(current_data, previous_data):
     return changes
 
 
-def format_status_message(status_output):
+def detect_platform_changes(label, unit, current_data, previous_data):
     """
-    Format the golemsp status output beautifully for Telegram.
+    Build notifications for new earnings and jobs on a Render-style platform.
 
     Args:
-        status_output: Raw output from golemsp status command
+        label: Platform name shown in the notification title
+        unit: Earnings unit appended to amounts, or "" for none
+        current_data: Parsed platform status from this check
+        previous_data: Parsed platform status from the previous check
 
     Returns:
-        str: Beautifully formatted message for Telegram
+        list: Notification messages, empty if nothing increased
     """
-    if not status_output:
-        return "❌ No status output received."
+    messages = []
+    suffix = f" {unit}" if unit else ""
+
+    prev_earnings = previous_data['total_earnings']
+    curr_earnings = current_data['total_earnings']
+    if curr_earnings > prev_earnings:
+        earnings_change = curr_earnings - prev_earnings
+        messages.append(
+            f"💰 <b>{label}: Earnings Update!</b>\n"
+            f"You've earned <code>{earnings_change:.6f}{suffix}</code>!\n"
+            f"Total earnings: <code>{curr_earnings:.6f}{suffix}</code>"
+        )
 
-    # Parse the status output and extract key information
-    lines = status_output.strip().split('\n')
+    prev_jobs = previous_data['active_jobs']
+    curr_jobs = current_data['active_jobs']
+    if curr_jobs > prev_jobs:
+        new_jobs = curr_jobs - prev_jobs
+        messages.append(
+            f"🎯 <b>{label}: New Job!</b>\n"
+            f"You've received {new_jobs} new job(s)!\n"
+            f"Active jobs: {curr_jobs}"
+        )
 
-    # Initialize data containers
-    service_info = {}
-    wallet_info = {}
-    tasks_info = {}
+    return messages
 
-    current_section = None
 
-    for line in lines:
-        # Clean the line by removing box drawing characters and extra whitespace
-        cleaned_line = line.replace('│', '').strip()
-        if not cleaned_line:
-            continue
+def current_timestamp():
+    """
+    Return the "Last updated" timestamp text for the current second.
 
-        # Detect sections
-        if 'Status' in cleaned_line and ('─' in line or 'Status' in cleaned_line):
-            current_section = 'status'
-            continue
-        elif 'Wallet' in cleaned_line and ('─' in line or 'Wallet' in cleaned_line):
-            current_section = 'wallet'
-            continue
-        elif 'Tasks' in cleaned_line and ('─' in line or 'Tasks' in cleaned_line):
-            current_section = 'tasks'
-            continue
+    The formatted text is reused for every message built within the same
+    second instead of calling strftime each time.
 
-        # Skip separator lines and box drawing
-        if any(char in line for char in ['─', '┌', '└', '├', '┤', '┐', '┘']):
-            continue
+    Returns:
+        str: Local time formatted as "YYYY-MM-DD HH:MM:SS UTC"
+    """
+    second = int(time.time())
+    if _timestamp_cache['second'] != second:
+        _timestamp_cache['second'] = second
+        _timestamp_cache['text'] = time.strftime("%Y-%m-%d %H:%M:%S UTC", time.localtime(second))
+    return _timestamp_cache['text']
+
+
+def format_service_lines(service):
+    """Build the Service Information lines from parsed service data."""
+    lines = [f"• Status: {'🟢 Running' if service.get('status') == 'running' else 'Unknown'}"]
+    if 'version' in service:
+        lines.append(f"• Version: <code>{html.escape(service['version'])}</code>")
+    if 'node_name' in service:
+        lines.append(f"• Node: <code>{html.escape(service['node_name'])}</code>")
+    if 'subnet' in service:
+        lines.append(f"• Subnet: <code>{html.escape(service['subnet'])}</code>")
+    if 'vm' in service:
+        lines.append("• VM Status: 🔴 Invalid Environment (Docker)")
+    return lines
+
+
+def format_wallet_lines(wallet):
+    """Build the Wallet Information lines from parsed wallet data."""
+    lines = []
+    if 'address' in wallet:
+        lines.append(f"• Address: <code>{html.escape(wallet['address'])}</code>")
+    if 'network' in wallet:
+        lines.append("• Network: 🌐 Mainnet")
+    if 'total' in wallet:
+        lines.append(f"• Balance: <code>{html.escape(wallet['total'])}</code>")
+    if 'pending' in wallet:
+        lines.append(f"• Pending: <code>{html.escape(wallet['pending'])}</code>")
+    return lines
+
+
+def format_tasks_lines(tasks):
+    """Build the Task Statistics lines from parsed tasks data."""
+    lines = []
+    if 'last_hour_processed' in tasks:
+        lines.append(f"• Last Hour Processed: <code>{tasks['last_hour_processed']}</code>")
+    if 'in_progress' in tasks:
+        lines.append(f"• Currently In Progress: <code>{tasks['in_progress']}</code>")
+    if 'total_processed' in tasks:
+        lines.append(f"• Total Processed: <code>{tasks['total_processed']}</code>")
+    return lines
+
+
+def format_status_message(status_data):
+    """
+    Format parsed golemsp status data beautifully for Telegram.
+
+    Args:
+        status_data: Parsed status data from parse_status_data()
+
+    Returns:
+        str: Beautifully formatted message for Telegram
+    """
+    if not status_data:
+        return "❌ No status output received."
 
-        # Parse status section
-        if current_section == 'status':
-            if 'Service' in cleaned_line and 'running' in cleaned_line:
-                service_info['status'] = '🟢 Running'
-            elif 'Version' in cleaned_line and any(char.isdigit() for char in cleaned_line):
-                service_info['version'] = cleaned_line.split('Version')[-1].strip()
-            elif 'Node Name' in cleaned_line:
-                service_info['node_name'] = cleaned_line.split('Node Name')[-1].strip()
-            elif 'Subnet' in cleaned_line:
-                service_info['subnet'] = cleaned_line.split('Subnet')[-1].strip()
-            elif 'VM' in cleaned_line and 'invalid environment' in cleaned_line:
-                service_info['vm'] = '🔴 Invalid Environment (Docker)'
-
-        # Parse wallet section
-        elif current_section == 'wallet':
-            if cleaned_line.startswith('0x') and len(cleaned_line) > 10:
-                wallet_info['address'] = f"`{cleaned_line}`"
-            elif 'network' in cleaned_line and 'mainnet' in cleaned_line:
-                wallet_info['network'] = '🌐 Mainnet'
-            elif 'amount (total)' in cleaned_line:
-                wallet_info['total'] = cleaned_line.split('amount (total)')[-1].strip()
-            elif cleaned_line.startswith('pending') and 'GLM' in cleaned_line:
-                wallet_info['pending'] = cleaned_line.split('pending')[-1].strip()
-
-        # Parse tasks section
-        elif current_section == 'tasks':
-            if 'last 1h processed' in cleaned_line:
-                tasks_info['last_hour'] = cleaned_line.split('last 1h processed')[-1].strip()
-            elif 'last 1h in progress' in cleaned_line:
-                tasks_info['in_progress'] = cleaned_line.split('last 1h in progress')[-1].strip()
-            elif 'total processed' in cleaned_line:
-                tasks_info['total'] = cleaned_line.split('total processed')[-1].strip()
+    service_info = status_data.get('service', {})
+    wallet_info = status_data.get('wallet', {})
+    tasks_info = status_data.get('tasks', {})
 
     # Build beautiful formatted message
     message_parts = []
 
     # Header
-    message_parts.append("🚀 *GolemSP Status Dashboard*\n")
+    message_parts.append("🚀 <b>GolemSP Status Dashboard</b>\n")
 
     # Service Status Section
     if service_info:
-        message_parts.append("📊 *Service Information*")
-        message_parts.append(f"• Status: {service_info.get('status', 'Unknown')}")
-        if 'version' in service_info:
-            message_parts.append(f"• Version: `{service_info['version']}`")
-        if 'node_name' in service_info:
-            message_parts.append(f"• Node: `{service_info['node_name']}`")
-        if 'subnet' in service_info:
-            message_parts.append(f"• Subnet: `{service_info['subnet']}`")
-        if 'vm' in service_info:
-            message_parts.append(f"• VM Status: {service_info['vm']}")
+        message_parts.append("📊 <b>Service Information</b>")
+        message_parts.extend(format_service_lines(service_info))
         message_parts.append("")
 
     # Wallet Section
     if wallet_info:
-        message_parts.append("💰 *Wallet Information*")
-        if 'address' in wallet_info:
-            message_parts.append(f"• Address: {wallet_info['address']}")
-        if 'network' in wallet_info:
-            message_parts.append(f"• Network: {wallet_info['network']}")
-        if 'total' in wallet_info:
-            message_parts.append(f"• Balance: `{wallet_info['total']}`")
-        if 'pending' in wallet_info:
-            message_parts.append(f"• Pending: `{wallet_info['pending']}`")
+        message_parts.append("💰 <b>Wallet Information</b>")
+        message_parts.extend(format_wallet_lines(wallet_info))
         message_parts.append("")
 
     # Tasks Section
     if tasks_info:
-        message_parts.append("⚡ *Task Statistics*")
-        if 'last_hour' in tasks_info:
-            message_parts.append(f"• Last Hour Processed: `{tasks_info['last_hour']}`")
-        if 'in_progress' in tasks_info:
-            message_parts.append(f"• Currently In Progress: `{tasks_info['in_progress']}`")
-        if 'total' in tasks_info:
-            message_parts.append(f"• Total Processed: `{tasks_info['total']}`")
+        message_parts.append("⚡ <b>Task Statistics</b>")
+        message_parts.extend(format_tasks_lines(tasks_info))
 
     # Footer with timestamp
-    from datetime import datetime
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
-    message_parts.append(f"\n🕒 Last updated: `{timestamp}`")
+    timestamp = current_timestamp()
+    message_parts.append(f"\n🕒 Last updated: <code>{timestamp}</code>")
 
     return '\n'.join(message_parts)
 
 
-def format_status_section(status_output):
-    """Format only the status section beautifully."""
-    if not status_output:
-        return "❌ No status output received."
+# Section key in parsed status data -> (title, line builder)
+STATUS_SECTIONS = {
+    'service': ("📊 <b>Service Information</b>", format_service_lines),
+    'wallet': ("💰 <b>Wallet Information</b>", format_wallet_lines),
+    'tasks': ("⚡ <b>Task Statistics</b>", format_tasks_lines),
+}
 
-    service_info = {}
 
-    lines = status_output.strip().split('\n')
-    current_section = None
+def format_section(status_data, section):
+    """
+    Format a single section of parsed golemsp status data.
 
-    for line in lines:
-        cleaned_line = line.replace('│', '').strip()
-        if not cleaned_line:
-            continue
+    Args:
+        status_data: Parsed status data from parse_status_data()
+        section: Key of STATUS_SECTIONS ('service', 'wallet' or 'tasks')
 
-        if 'Status' in cleaned_line and ('─' in line or 'Status' in cleaned_line):
-            current_section = 'status'
-            continue
+    Returns:
+        str: Formatted section message for Telegram
+    """
+    if not status_data:
+        return "❌ No status output received."
 
-        if any(char in line for char in ['─', '┌', '└', '├', '┤', '┐', '┘']):
-            continue
+    title, format_lines = STATUS_SECTIONS[section]
+    message_parts = [title]
+    message_parts.extend(format_lines(status_data.get(section, {})))
 
-        if current_section == 'status':
-            if 'Service' in cleaned_line and 'running' in cleaned_line:
-                service_info['status'] = '🟢 Running'
-            elif 'Version' in cleaned_line and any(char.isdigit() for char in cleaned_line):
-                service_info['version'] = cleaned_line.split('Version')[-1].strip()
-            elif 'Node Name' in cleaned_line:
-                service_info['node_name'] = cleaned_line.split('Node Name')[-1].strip()
-            elif 'Subnet' in cleaned_line:
-                service_info['subnet'] = cleaned_line.split('Subnet')[-1].strip()
-            elif 'VM' in cleaned_line and 'invalid environment' in cleaned_line:
-                service_info['vm'] = '🔴 Invalid Environment (Docker)'
-
-    message_parts = ["📊 *Service Information*"]
-    message_parts.append(f"• Status: {service_info.get('status', 'Unknown')}")
-    if 'version' in service_info:
-        message_parts.append(f"• Version: `{service_info['version']}`")
-    if 'node_name' in service_info:
-        message_parts.append(f"• Node: `{service_info['node_name']}`")
-    if 'subnet' in service_info:
-        message_parts.append(f"• Subnet: `{service_info['subnet']}`")
-    if 'vm' in service_info:
-        message_parts.append(f"• VM Status: {service_info['vm']}")
-
-    from datetime import datetime
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
-    message_parts.append(f"\n🕒 Last updated: `{timestamp}`")
+    timestamp = current_timestamp()
+    message_parts.append(f"\n🕒 Last updated: <code>{timestamp}</code>")
 
     return '\n'.join(message_parts)
 
 
-def format_wallet_section(status_output):
-    """Format only the wallet section beautifully."""
-    if not status_output:
-        return "❌ No status output received."
-
-    wallet_info = {}
-
-    lines = status_output.strip().split('\n')
-    current_section = None
-
-    for line in lines:
-        cleaned_line = line.replace('│', '').strip()
-        if not cleaned_line:
-            continue
-
-        if 'Wallet' in cleaned_line and ('─' in line or 'Wallet' in cleaned_line):
-            current_section = 'wallet'
-            continue
-
-        if any(char in line for char in ['─', '┌', '└', '├', '┤', '┐', '┘']):
-            continue
+def format_status_section(status_data):
+    """Format only the status section beautifully."""
+    return format_section(status_data, 'service')
 
-        if current_section == 'wallet':
-            if cleaned_line.startswith('0x') and len(cleaned_line) > 10:
-                wallet_info['address'] = f"`{cleaned_line}`"
-            elif 'network' in cleaned_line and 'mainnet' in cleaned_line:
-                wallet_info['network'] = '🌐 Mainnet'
-            elif 'amount (total)' in cleaned_line:
-                wallet_info['total'] = cleaned_line.split('amount (total)')[-1].strip()
-            elif cleaned_line.startswith('pending') and 'GLM' in cleaned_line:
-                wallet_info['pending'] = cleaned_line.split('pending')[-1].strip()
-
-    message_parts = ["💰 *Wallet Information*"]
-    if 'address' in wallet_info:
-        message_parts.append(f"• Address: {wallet_info['address']}")
-    if 'network' in wallet_info:
-        message_parts.append(f"• Network: {wallet_info['network']}")
-    if 'total' in wallet_info:
-        message_parts.append(f"• Balance: `{wallet_info['total']}`")
-    if 'pending' in wallet_info:
-        message_parts.append(f"• Pending: `{wallet_info['pending']}`")
-
-    from datetime import datetime
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
-    message_parts.append(f"\n🕒 Last updated: `{timestamp}`")
 
-    return '\n'.join(message_parts)
+def format_wallet_section(status_data):
+    """Format only the wallet section beautifully."""
+    return format_section(status_data, 'wallet')
 
 
-def format_tasks_section(status_output):
+def format_tasks_section(status_data):
     """Format only the tasks section beautifully."""
-    if not status_output:
-        return "❌ No status output received."
-
-    tasks_info = {}
-
-    lines = status_output.strip().split('\n')
-    current_section = None
-
-    for line in lines:
-        cleaned_line = line.replace('│', '').strip()
-        if not cleaned_line:
-            continue
-
-        if 'Tasks' in cleaned_line and ('─' in line or 'Tasks' in cleaned_line):
-            current_section = 'tasks'
-            continue
-
-        if any(char in line for char in ['─', '┌', '└', '├', '┤', '┐', '┘']):
-            continue
-
-        if current_section == 'tasks':
-            if 'last 1h processed' in cleaned_line:
-                tasks_info['last_hour'] = cleaned_line.split('last 1h processed')[-1].strip()
-            elif 'last 1h in progress' in cleaned_line:
-                tasks_info['in_progress'] = cleaned_line.split('last 1h in progress')[-1].strip()
-            elif 'total processed' in cleaned_line:
-                tasks_info['total'] = cleaned_line.split('total processed')[-1].strip()
-
-    message_parts = ["⚡ *Task Statistics*"]
-    if 'last_hour' in tasks_info:
-        message_parts.append(f"• Last Hour Processed: `{tasks_info['last_hour']}`")
-    if 'in_progress' in tasks_info:
-        message_parts.append(f"• Currently In Progress: `{tasks_info['in_progress']}`")
-    if 'total' in tasks_info:
-        message_parts.append(f"• Total Processed: `{tasks_info['total']}`")
-
-    from datetime import datetime
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
-    message_parts.append(f"\n🕒 Last updated: `{timestamp}`")
-
-    return '\n'.join(message_parts)
+    return format_section(status_data, 'tasks')
 
 
 async def enable_notifications(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -674,14 +1019,13 @@ async def enable_notifications(update: Update, context: ContextTypes.DEFAULT_TYP
     register_user(chat_id)
 
     await update.message.reply_text(
-        "✅ *Notifications Enabled!*\n\n"
+        "✅ <b>Notifications Enabled!</b>\n\n"
         "You'll now receive notifications when:\n"
         "• You get new jobs\n"
         "• Jobs are completed\n"
         "• You receive payments (GLM)\n\n"
         "Use /disable_notifications to stop receiving alerts.",
-        parse_mode='Markdown',
-        reply_markup=get_reply_keyboard()
+        reply_markup=REPLY_KEYBOARD
     )
 
 
@@ -691,11 +1035,10 @@ async def disable_notifications(update: Update, context: ContextTypes.DEFAULT_TY
     unregister_user(chat_id)
 
     await update.message.reply_text(
-        "🔕 *Notifications Disabled*\n\n"
+        "🔕 <b>Notifications Disabled</b>\n\n"
         "You won't receive job and payment notifications anymore.\n\n"
         "Use /enable_notifications to start receiving alerts again.",
-        parse_mode='Markdown',
-        reply_markup=get_reply_keyboard()
+        reply_markup=REPLY_KEYBOARD
     )
 
 
@@ -704,7 +1047,7 @@ async def notification_status(update: Update, context: ContextTypes.DEFAULT_TYPE
     chat_id = update.message.chat_id
     is_registered = chat_id in registered_users
 
-    status_text = "🔔 *Notifications: ENABLED*" if is_registered else "🔕 *Notifications: DISABLED*"
+    status_text = "🔔 <b>Notifications: ENABLED</b>" if is_registered else "🔕 <b>Notifications: DISABLED</b>"
 
     if is_registered:
         status_text += "\n\nYou're receiving notifications for jobs and payments."
@@ -713,28 +1056,10 @@ async def notification_status(update: Update, context: ContextTypes.DEFAULT_TYPE
 
     await update.message.reply_text(
         status_text,
-        parse_mode='Markdown',
-        reply_markup=get_reply_keyboard()
+        reply_markup=REPLY_KEYBOARD
     )
 
 
-def get_reply_keyboard():
-    """Create the persistent reply keyboard."""
-    keyboard = [
-        [KeyboardButton("📊 Service Status"), KeyboardButton("💰 Wallet Info")],
-        [KeyboardButton("⚡ Task Statistics")]
-    ]
-    
-    # Always show platform buttons, even if not enabled
-    platform_row = []
-    platform_row.append(KeyboardButton("🎨 Render Status"))
-    platform_row.append(KeyboardButton("🤖 AI Training Status"))
-    keyboard.append(platform_row)
-    keyboard.append([KeyboardButton("🌐 All Platforms")])
-    
-    return ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=False)
-
-
 async def send_notification(bot, chat_id, message):
     """
     Send a notification message to the user.
@@ -744,43 +1069,144 @@ async def send_notification(bot, chat_id, message):
         chat_id: Chat ID to send notification to
         message: Notification message
     """
-    try:
-        await bot.send_message(
-            chat_id=chat_id,
-            text=message,
-            parse_mode='Markdown'
-        )
-        logger.info(f"Notification sent: {message[:50]}...")
-    except Exception as e:
-        logger.error(f"Failed to send notification: {e}")
+    global notifications_resume_at
+
+    from telegram.error import RetryAfter
+
+    for attempt in range(2):
+        # Respect a flood-control pause reported by any earlier send
+        pause = notifications_resume_at - time.monotonic()
+        if pause > 0:
+            await asyncio.sleep(pause)
+
+        try:
+            await bot.send_message(
+                chat_id=chat_id,
+                text=message
+            )
+            logger.info(f"Notification sent: {message[:50]}...")
+            return
+        except RetryAfter as e:
+            # Flood control: pause all sends as long as Telegram asks, then
+            # retry once. The pause applies even when giving up, so other
+            # concurrent sends back off too.
+            delay = e.retry_after
+            if isinstance(delay, timedelta):
+                delay = delay.total_seconds()
+            notifications_resume_at = max(notifications_resume_at, time.monotonic() + delay)
+            if attempt:
+                logger.error(f"Failed to send notification: {e}")
+                return
+        except Exception as e:
+            logger.error(f"Failed to send notification: {e}")
+            return
+
+
+async def broadcast_notification(bot, chat_ids, message):
+    """
+    Send the same notification to several chats concurrently.
+
+    At most NOTIFICATION_CONCURRENCY sends are in flight at once to stay
+    within Telegram's global rate limit. A failed send is logged and does
+    not affect the others.
+
+    Args:
+        bot: Telegram bot instance
+        chat_ids: Chat IDs to notify
+        message: Notification message
+    """
+    semaphore = asyncio.Semaphore(NOTIFICATION_CONCURRENCY)
+
+    async def send_limited(chat_id):
+        async with semaphore:
+            await send_notification(bot, chat_id, message)
+
+    # One unexpected failure must not cancel the remaining sends
+    results = await asyncio.gather(
+        *(send_limited(chat_id) for chat_id in chat_ids),
+        return_exceptions=True
+    )
+    for chat_id, result in zip(chat_ids, results):
+        if isinstance(result, BaseException):
+            logger.error(f"Failed to send notification to {chat_id}: {result!r}")
+
+
+async def run_in_thread(func, *args):
+    """
+    Run a blocking function in the default executor without blocking the loop.
+
+    Equivalent to asyncio.to_thread(), which is not available on Python 3.8.
+
+    Args:
+        func: Function to call
+        *args: Positional arguments for func
+
+    Returns:
+        Whatever func returns
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+async def run_platform_check(enabled, check):
+    """
+    Run a blocking platform status check in a worker thread.
+
+    Args:
+        enabled: Whether the platform is enabled; disabled platforms are skipped
+        check: Status check returning (success, data, error)
+
+    Returns:
+        tuple or None: Result of check, or None if the platform is disabled
+    """
+    if not enabled:
+        return None
+    return await run_in_thread(check)
 
 
 async def monitoring_loop(application):
     """
     Background monitoring loop that checks for job and payment changes across all platforms.
     """
-    global last_status_data
+    global last_status_data, last_monitored_output
 
     logger.info(f"Starting monitoring loop with {MONITORING_INTERVAL}s interval")
 
-    # Load previous state
-    previous_state = load_previous_state()
-    previous_render_state = previous_state.get('render', {})
-    previous_ai_state = previous_state.get('ai_training', {})
+    # Load previous state; state file IO runs in a worker thread so it
+    # never stalls the event loop
+    previous_state = await run_in_thread(load_previous_state)
+    # Fill in the compared fields so the checks below can index directly
+    previous_render_state = {**PLATFORM_STATE_DEFAULTS, **previous_state.get('render', {})}
+    previous_ai_state = {**PLATFORM_STATE_DEFAULTS, **previous_state.get('ai_training', {})}
+
+    # Number of notification broadcasts sent, used to rotate send order
+    notification_round = 0
+
+    # Consecutive checks without any notification, used for backoff
+    idle_cycles = 0
+    max_interval = max(MONITORING_MAX_INTERVAL, MONITORING_INTERVAL)
 
     while True:
+        notification_messages = []
+
         try:
             # Check if monitoring is still enabled
             if not MONITORING_ENABLED:
                 logger.info("Monitoring disabled, stopping loop")
                 break
 
-            notification_messages = []
+            # Query all platforms at once instead of one after another
+            golem_result, render_result, ai_result = await asyncio.gather(
+                run_golemsp_status(),
+                run_platform_check(RENDER_NETWORK_ENABLED, check_render_status),
+                run_platform_check(AI_TRAINING_ENABLED, check_ai_training_status)
+            )
 
-            # Check GolemSP status
-            success, output, error = run_golemsp_status()
-            if success:
-                current_data = parse_status_data(output)
+            # Check GolemSP status; identical output means nothing changed,
+            # so parsing and change detection are skipped
+            success, output, error = golem_result
+            if success and output != last_monitored_output:
+                last_monitored_output = output
+                current_data = get_status_data(output)
                 golem_previous = previous_state.get('golem', {})
 
                 # Detect changes
@@ -792,7 +1218,7 @@ async def monitoring_loop(application):
                         previous_jobs = golem_previous.get('tasks', {}).get('in_progress', 0)
                         new_jobs_count = current_jobs - previous_jobs
                         notification_messages.append(
-                            f"🎯 *GolemSP: New Job Alert!*\n"
+                            f"🎯 <b>GolemSP: New Job Alert!</b>\n"
                             f"You've received {new_jobs_count} new task(s)!\n"
                             f"Currently processing: {current_jobs} tasks"
                         )
@@ -802,7 +1228,7 @@ async def monitoring_loop(application):
                         previous_total = golem_previous.get('tasks', {}).get('total_processed', 0)
                         completed_count = current_total - previous_total
                         notification_messages.append(
-                            f"✅ *GolemSP: Job Completed!*\n"
+                            f"✅ <b>GolemSP: Job Completed!</b>\n"
                             f"Successfully completed {completed_count} task(s)!\n"
                             f"Total processed: {current_total} tasks"
                         )
@@ -811,97 +1237,106 @@ async def monitoring_loop(application):
                         balance_change = changes['wallet_balance_change']
                         current_balance = current_data.get('wallet', {}).get('total_glm', 0.0)
                         notification_messages.append(
-                            f"💰 *GolemSP: Payment Received!*\n"
-                            f"You've received `{balance_change:.6f} GLM`!\n"
-                            f"Current balance: `{current_balance:.6f} GLM`"
+                            f"💰 <b>GolemSP: Payment Received!</b>\n"
+                            f"You've received <code>{balance_change:.6f} GLM</code>!\n"
+                            f"Current balance: <code>{current_balance:.6f} GLM</code>"
                         )
 
-                # Update previous state
-                previous_state['golem'] = current_data.copy()
-            else:
+                # Update previous state; parsed data is never mutated, so it
+                # can be kept without copying
+                previous_state['golem'] = current_data
+            elif not success:
                 logger.warning(f"Failed to get GolemSP status in monitoring loop: {error}")
 
             # Check Render Network status
             if RENDER_NETWORK_ENABLED:
-                success, data, error = check_render_status()
+                success, data, error = render_result
                 if success:
                     current_render_data = parse_render_status(data)
-                    
-                    # Check for changes
-                    prev_earnings = previous_render_state.get('total_earnings', 0.0)
-                    curr_earnings = current_render_data.get('total_earnings', 0.0)
-                    prev_jobs = previous_render_state.get('active_jobs', 0)
-                    curr_jobs = current_render_data.get('active_jobs', 0)
-                    
-                    if curr_earnings > prev_earnings and registered_users:
-                        earnings_change = curr_earnings - prev_earnings
-                        notification_messages.append(
-                            f"💰 *Render Network: Earnings Update!*\n"
-                            f"You've earned `{earnings_change:.6f} RENDER`!\n"
-                            f"Total earnings: `{curr_earnings:.6f} RENDER`"
-                        )
-                    
-                    if curr_jobs > prev_jobs and registered_users:
-                        new_jobs = curr_jobs - prev_jobs
-                        notification_messages.append(
-                            f"🎯 *Render Network: New Job!*\n"
-                            f"You've received {new_jobs} new job(s)!\n"
-                            f"Active jobs: {curr_jobs}"
-                        )
-                    
-                    previous_render_state = current_render_data.copy()
+                    if registered_users:
+                        notification_messages.extend(detect_platform_changes(
+                            "Render Network", "RENDER", current_render_data, previous_render_state
+                        ))
+                    previous_render_state = current_render_data
                 else:
                     logger.warning(f"Failed to get Render Network status: {error}")
 
             # Check AI Training status
             if AI_TRAINING_ENABLED:
-                success, data, error = check_ai_training_status()
+                success, data, error = ai_result
                 if success:
                     current_ai_data = parse_ai_training_status(data)
-                    
-                    # Check for changes
-                    prev_earnings = previous_ai_state.get('total_earnings', 0.0)
-                    curr_earnings = current_ai_data.get('total_earnings', 0.0)
-                    prev_jobs = previous_ai_state.get('active_jobs', 0)
-                    curr_jobs = current_ai_data.get('active_jobs', 0)
-                    
-                    if curr_earnings > prev_earnings and registered_users:
-                        earnings_change = curr_earnings - prev_earnings
-                        notification_messages.append(
-                            f"💰 *AI Training: Earnings Update!*\n"
-                            f"You've earned `{earnings_change:.6f}`!\n"
-                            f"Total earnings: `{curr_earnings:.6f}`"
-                        )
-                    
-                    if curr_jobs > prev_jobs and registered_users:
-                        new_jobs = curr_jobs - prev_jobs
-                        notification_messages.append(
-                            f"🎯 *AI Training: New Job!*\n"
-                            f"You've received {new_jobs} new job(s)!\n"
-                            f"Active jobs: {curr_jobs}"
-                        )
-                    
-                    previous_ai_state = current_ai_data.copy()
+                    if registered_users:
+                        notification_messages.extend(detect_platform_changes(
+                            "AI Training", "", current_ai_data, previous_ai_state
+                        ))
+                    previous_ai_state = current_ai_data
                 else:
                     logger.warning(f"Failed to get AI Training status: {error}")
 
-            # Send notifications to all registered users
+            # Send one combined message to every registered user
             if notification_messages and registered_users:
-                for chat_id in registered_users.copy():
-                    for message in notification_messages:
-                        await send_notification(application.bot, chat_id, message)
-                        await asyncio.sleep(0.1)  # Small delay to avoid rate limiting
+                # Rotate the starting user each round so the same users are
+                # not always last when sends are throttled
+                chat_ids = tuple(registered_users)
+                start_index = notification_round % len(chat_ids)
+                notification_round += 1
+                await broadcast_notification(
+                    application.bot,
+                    chat_ids[start_index:] + chat_ids[:start_index],
+                    '\n\n'.join(notification_messages)
+                )
 
             # Save current state for next comparison
             previous_state['render'] = previous_render_state
             previous_state['ai_training'] = previous_ai_state
-            save_current_state(previous_state)
+            await run_in_thread(save_current_state, previous_state)
 
         except Exception as e:
             logger.error(f"Error in monitoring loop: {e}")
 
-        # Wait for next check
-        await asyncio.sleep(MONITORING_INTERVAL)
+        # Wait for next check, backing off while nothing changes
+        if notification_messages:
+            idle_cycles = 0
+        interval = min(MONITORING_INTERVAL * 2 ** idle_cycles, max_interval)
+        if not notification_messages and interval < max_interval:
+            idle_cycles += 1
+
+        try:
+            await asyncio.wait_for(monitoring_wake_event.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+        monitoring_wake_event.clear()
+
+        if monitoring_stop_event.is_set():
+            logger.info("Monitoring stop requested, stopping loop")
+            break
+
+
+# Static reply to /start
+WELCOME_MESSAGE = (
+    "🎉 <b>Welcome to Multi-Platform Status Bot!</b>\n\n"
+    "✅ Notifications are now <b>ENABLED</b> for you!\n\n"
+    "You'll receive alerts when:\n"
+    "• 🎯 You get new jobs\n"
+    "• ✅ Jobs are completed\n"
+    "• 💰 You receive payments\n\n"
+    "Use the buttons below to check specific information:\n"
+    "📊 Service Status - GolemSP node and service details\n"
+    "💰 Wallet Info - GolemSP balance and address\n"
+    "⚡ Task Statistics - GolemSP processing metrics\n"
+    "🎨 Render Status - Render Network status\n"
+    "🤖 AI Training Status - AI training platforms status\n"
+    "🌐 All Platforms - Combined status of all platforms\n\n"
+    "Or use these commands:\n"
+    "/status - Check full GolemSP status\n"
+    "/render_status - Check Render Network status\n"
+    "/ai_status - Check AI Training status\n"
+    "/all_status - Check all platforms status\n"
+    "/enable_notifications - Enable notifications\n"
+    "/disable_notifications - Disable notifications\n"
+    "/notification_status - Check notification settings"
+)
 
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -911,191 +1346,192 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     # Automatically register user for notifications
     register_user(chat_id)
 
-    welcome_message = (
-        "🎉 *Welcome to Multi-Platform Status Bot!*\n\n"
-        "✅ Notifications are now *ENABLED* for you!\n\n"
-        "You'll receive alerts when:\n"
-        "• 🎯 You get new jobs\n"
-        "• ✅ Jobs are completed\n"
-        "• 💰 You receive payments\n\n"
-        "Use the buttons below to check specific information:\n"
-        "📊 Service Status - GolemSP node and service details\n"
-        "💰 Wallet Info - GolemSP balance and address\n"
-        "⚡ Task Statistics - GolemSP processing metrics\n"
-    )
-    
-    welcome_message += (
-        "🎨 Render Status - Render Network status\n"
-        "🤖 AI Training Status - AI training platforms status\n"
-        "🌐 All Platforms - Combined status of all platforms\n\n"
-        "Or use these commands:\n"
-        "/status - Check full GolemSP status\n"
-        "/render_status - Check Render Network status\n"
-        "/ai_status - Check AI Training status\n"
-        "/all_status - Check all platforms status\n"
-        "/enable_notifications - Enable notifications\n"
-        "/disable_notifications - Disable notifications\n"
-        "/notification_status - Check notification settings"
+    await update.message.reply_text(
+        WELCOME_MESSAGE,
+        reply_markup=REPLY_KEYBOARD
     )
 
+
+async def send_golem_status(update: Update, context: ContextTypes.DEFAULT_TYPE, formatter):
+    """
+    Fetch GolemSP status and reply with it.
+
+    Args:
+        update: Incoming Telegram update
+        context: Handler context
+        formatter: Function turning parsed golemsp status data into a message
+    """
+    if golemsp_status_is_fresh():
+        # Cached result, the reply goes out right away
+        success, output, error = await run_golemsp_status()
+    else:
+        # Show typing indicator while golemsp runs; the two calls are independent
+        _, (success, output, error) = await asyncio.gather(
+            context.bot.send_chat_action(
+                chat_id=update.message.chat_id,
+                action='typing'
+            ),
+            run_golemsp_status()
+        )
+    if success:
+        request_monitoring_check(output)
+        formatted_message = render_golem_status(output, formatter)
+    else:
+        formatted_message = f"❌ Error checking GolemSP status:\n\n<code>{html.escape(error)}</code>"
+
     await update.message.reply_text(
-        welcome_message,
-        parse_mode='Markdown',
-        reply_markup=get_reply_keyboard()
+        formatted_message,
+        reply_markup=REPLY_KEYBOARD
     )
 
 
-async def handle_keyboard_button(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Handle keyboard button presses."""
-    text = update.message.text
+# GolemSP keyboard buttons and the formatter used for each
+GOLEM_BUTTON_FORMATTERS = {
+    "📊 Service Status": format_status_section,
+    "💰 Wallet Info": format_wallet_section,
+    "⚡ Task Statistics": format_tasks_section,
+}
 
-    # Show typing indicator
-    await context.bot.send_chat_action(
-        chat_id=update.message.chat_id,
-        action='typing'
+
+async def build_render_button_message():
+    """Build the reply for the Render Status keyboard button."""
+    if not RENDER_NETWORK_ENABLED:
+        return (
+            "🎨 <b>Render Network Status</b>\n\n"
+            "⚠️ Render Network monitoring is not enabled.\n\n"
+            "To enable:\n"
+            "1. Set <code>RENDER_NETWORK_ENABLED=true</code> in your <code>.env</code> file\n"
+            "2. Restart the bot\n"
+            "3. Ensure Render Network worker is installed and running\n\n"
+            "Note: Without GPU, Render Network earnings will be limited."
+        )
+
+    success, data, error = await run_in_thread(check_render_status)
+    if success:
+        return format_render_status(parse_render_status(data))
+    return f"❌ Error checking Render Network status:\n\n<code>{html.escape(error)}</code>"
+
+
+async def build_ai_button_message():
+    """Build the reply for the AI Training Status keyboard button."""
+    if not AI_TRAINING_ENABLED:
+        return (
+            "🤖 <b>AI Training Platform Status</b>\n\n"
+            "⚠️ AI Training platform monitoring is not enabled.\n\n"
+            "To enable:\n"
+            "1. Set <code>AI_TRAINING_ENABLED=true</code> in your <code>.env</code> file\n"
+            "2. Restart the bot\n"
+            "3. Install and configure AI training platform workers:\n"
+            "   - Together.ai: https://together.ai\n"
+            "   - Akash Network: https://akash.network\n\n"
+            "⚠️ Important: Without GPU, AI training earnings will be very limited.\n"
+            "Most AI workloads require GPU acceleration."
+        )
+
+    success, data, error = await run_in_thread(check_ai_training_status)
+    if success:
+        return format_ai_training_status(parse_ai_training_status(data))
+    return f"❌ Error checking AI Training status:\n\n<code>{html.escape(error)}</code>"
+
+
+async def build_all_platforms_message():
+    """Build the combined status summary for all platforms."""
+    message_parts = ["🌐 <b>All Platforms Status</b>\n\n"]
+
+    golem_result, render_result, ai_result = await asyncio.gather(
+        run_golemsp_status(),
+        run_platform_check(RENDER_NETWORK_ENABLED, check_render_status),
+        run_platform_check(AI_TRAINING_ENABLED, check_ai_training_status)
     )
 
-    # Handle GolemSP buttons
-    if text in ["📊 Service Status", "💰 Wallet Info", "⚡ Task Statistics"]:
-        success, output, error = run_golemsp_status()
+    # GolemSP status
+    success, output, error = golem_result
+    if success:
+        request_monitoring_check(output)
+        golem_data = get_status_data(output)
+        golem_balance = golem_data.get('wallet', {}).get('total_glm', 0.0)
+        golem_tasks = golem_data.get('tasks', {}).get('in_progress', 0)
+        message_parts.append("🚀 <b>GolemSP</b>\n")
+        message_parts.append(f"• Balance: <code>{golem_balance:.6f} GLM</code>\n")
+        message_parts.append(f"• Active Tasks: <code>{golem_tasks}</code>\n\n")
+    else:
+        message_parts.append("🚀 <b>GolemSP</b>: ❌ Error\n\n")
+
+    # Render Network status
+    if RENDER_NETWORK_ENABLED:
+        success, data, error = render_result
         if success:
-            if text == "📊 Service Status":
-                formatted_message = format_status_section(output)
-            elif text == "💰 Wallet Info":
-                formatted_message = format_wallet_section(output)
-            elif text == "⚡ Task Statistics":
-                formatted_message = format_tasks_section(output)
-        else:
-            formatted_message = f"❌ Error checking GolemSP status:\n\n`{error}`"
-    
-    # Handle Render Network button
-    elif text == "🎨 Render Status":
-        if not RENDER_NETWORK_ENABLED:
-            formatted_message = (
-                "🎨 *Render Network Status*\n\n"
-                "⚠️ Render Network monitoring is not enabled.\n\n"
-                "To enable:\n"
-                "1. Set `RENDER_NETWORK_ENABLED=true` in your `.env` file\n"
-                "2. Restart the bot\n"
-                "3. Ensure Render Network worker is installed and running\n\n"
-                "Note: Without GPU, Render Network earnings will be limited."
-            )
-        else:
-            success, data, error = check_render_status()
-            if success:
-                parsed_data = parse_render_status(data)
-                formatted_message = format_render_status(parsed_data)
-            else:
-                formatted_message = f"❌ Error checking Render Network status:\n\n`{error}`"
-    
-    # Handle AI Training button
-    elif text == "🤖 AI Training Status":
-        if not AI_TRAINING_ENABLED:
-            formatted_message = (
-                "🤖 *AI Training Platform Status*\n\n"
-                "⚠️ AI Training platform monitoring is not enabled.\n\n"
-                "To enable:\n"
-                "1. Set `AI_TRAINING_ENABLED=true` in your `.env` file\n"
-                "2. Restart the bot\n"
-                "3. Install and configure AI training platform workers:\n"
-                "   - Together.ai: https://together.ai\n"
-                "   - Akash Network: https://akash.network\n\n"
-                "⚠️ Important: Without GPU, AI training earnings will be very limited.\n"
-                "Most AI workloads require GPU acceleration."
-            )
+            render_data = parse_render_status(data)
+            render_earnings = render_data.get('total_earnings', 0.0)
+            render_jobs = render_data.get('active_jobs', 0)
+            message_parts.append("🎨 <b>Render Network</b>\n")
+            message_parts.append(f"• Earnings: <code>{render_earnings:.6f} RENDER</code>\n")
+            message_parts.append(f"• Active Jobs: <code>{render_jobs}</code>\n\n")
         else:
-            success, data, error = check_ai_training_status()
-            if success:
-                parsed_data = parse_ai_training_status(data)
-                formatted_message = format_ai_training_status(parsed_data)
-            else:
-                formatted_message = f"❌ Error checking AI Training status:\n\n`{error}`"
-    
-    # Handle All Platforms button
-    elif text == "🌐 All Platforms":
-        formatted_message = "🌐 *All Platforms Status*\n\n"
-        
-        # GolemSP status
-        success, output, error = run_golemsp_status()
+            message_parts.append("🎨 <b>Render Network</b>: ❌ Error\n\n")
+    else:
+        message_parts.append("🎨 <b>Render Network</b>: ⚠️ Not enabled\n\n")
+
+    # AI Training status
+    if AI_TRAINING_ENABLED:
+        success, data, error = ai_result
         if success:
-            golem_data = parse_status_data(output)
-            golem_balance = golem_data.get('wallet', {}).get('total_glm', 0.0)
-            golem_tasks = golem_data.get('tasks', {}).get('in_progress', 0)
-            formatted_message += f"🚀 *GolemSP*\n"
-            formatted_message += f"• Balance: `{golem_balance:.6f} GLM`\n"
-            formatted_message += f"• Active Tasks: `{golem_tasks}`\n\n"
-        else:
-            formatted_message += f"🚀 *GolemSP*: ❌ Error\n\n"
-        
-        # Render Network status
-        if RENDER_NETWORK_ENABLED:
-            success, data, error = check_render_status()
-            if success:
-                render_data = parse_render_status(data)
-                render_earnings = render_data.get('total_earnings', 0.0)
-                render_jobs = render_data.get('active_jobs', 0)
-                formatted_message += f"🎨 *Render Network*\n"
-                formatted_message += f"• Earnings: `{render_earnings:.6f} RENDER`\n"
-                formatted_message += f"• Active Jobs: `{render_jobs}`\n\n"
-            else:
-                formatted_message += f"🎨 *Render Network*: ❌ Error\n\n"
-        else:
-            formatted_message += f"🎨 *Render Network*: ⚠️ Not enabled\n\n"
-        
-        # AI Training status
-        if AI_TRAINING_ENABLED:
-            success, data, error = check_ai_training_status()
-            if success:
-                ai_data = parse_ai_training_status(data)
-                ai_earnings = ai_data.get('total_earnings', 0.0)
-                ai_jobs = ai_data.get('active_jobs', 0)
-                formatted_message += f"🤖 *AI Training*\n"
-                formatted_message += f"• Earnings: `{ai_earnings:.6f}`\n"
-                formatted_message += f"• Active Jobs: `{ai_jobs}`\n\n"
-            else:
-                formatted_message += f"🤖 *AI Training*: ❌ Error\n\n"
+            ai_data = parse_ai_training_status(data)
+            ai_earnings = ai_data.get('total_earnings', 0.0)
+            ai_jobs = ai_data.get('active_jobs', 0)
+            message_parts.append("🤖 <b>AI Training</b>\n")
+            message_parts.append(f"• Earnings: <code>{ai_earnings:.6f}</code>\n")
+            message_parts.append(f"• Active Jobs: <code>{ai_jobs}</code>\n\n")
         else:
-            formatted_message += f"🤖 *AI Training*: ⚠️ Not enabled\n\n"
-        
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
-        formatted_message += f"🕒 Last updated: `{timestamp}`"
-    
+            message_parts.append("🤖 <b>AI Training</b>: ❌ Error\n\n")
+    else:
+        message_parts.append("🤖 <b>AI Training</b>: ⚠️ Not enabled\n\n")
+
+    timestamp = current_timestamp()
+    message_parts.append(f"🕒 Last updated: <code>{timestamp}</code>")
+
+    return "".join(message_parts)
+
+
+# Other keyboard buttons and the coroutine building each reply
+PLATFORM_BUTTON_BUILDERS = {
+    "🎨 Render Status": build_render_button_message,
+    "🤖 AI Training Status": build_ai_button_message,
+    "🌐 All Platforms": build_all_platforms_message,
+}
+
+
+async def handle_keyboard_button(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle keyboard button presses."""
+    text = update.message.text
+
+    # Handle GolemSP buttons
+    formatter = GOLEM_BUTTON_FORMATTERS.get(text)
+    if formatter:
+        await send_golem_status(update, context, formatter)
+        return
+
+    builder = PLATFORM_BUTTON_BUILDERS.get(text)
+    if builder:
+        # Show typing indicator
+        await context.bot.send_chat_action(
+            chat_id=update.message.chat_id,
+            action='typing'
+        )
+        formatted_message = await builder()
     else:
         # Unknown button, show help
         formatted_message = "Please use the buttons below to check platform information."
 
     await update.message.reply_text(
         formatted_message,
-        parse_mode='Markdown',
-        reply_markup=get_reply_keyboard()
+        reply_markup=REPLY_KEYBOARD
     )
 
 
 async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /status command directly."""
-    # Show typing indicator
-    await context.bot.send_chat_action(
-        chat_id=update.message.chat_id,
-        action='typing'
-    )
-    
-    # Run the status command
-    success, output, error = run_golemsp_status()
-    
-    if success:
-        formatted_message = format_status_message(output)
-        await update.message.reply_text(
-            formatted_message,
-            parse_mode='Markdown',
-            reply_markup=get_reply_keyboard()
-        )
-    else:
-        error_message = f"❌ Error checking GolemSP status:\n\n`{error}`"
-        await update.message.reply_text(
-            error_message,
-            parse_mode='Markdown',
-            reply_markup=get_reply_keyboard()
-        )
+    await send_golem_status(update, context, format_status_message)
 
 
 async def render_status_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -1103,8 +1539,7 @@ async def render_status_command(update: Update, context: ContextTypes.DEFAULT_TY
     if not RENDER_NETWORK_ENABLED:
         await update.message.reply_text(
             "❌ Render Network is not enabled. Set RENDER_NETWORK_ENABLED=true in .env",
-            parse_mode='Markdown',
-            reply_markup=get_reply_keyboard()
+            reply_markup=REPLY_KEYBOARD
         )
         return
     
@@ -1113,17 +1548,16 @@ async def render_status_command(update: Update, context: ContextTypes.DEFAULT_TY
         action='typing'
     )
     
-    success, data, error = check_render_status()
+    success, data, error = await run_in_thread(check_render_status)
     if success:
         parsed_data = parse_render_status(data)
         formatted_message = format_render_status(parsed_data)
     else:
-        formatted_message = f"❌ Error checking Render Network status:\n\n`{error}`"
+        formatted_message = f"❌ Error checking Render Network status:\n\n<code>{html.escape(error)}</code>"
     
     await update.message.reply_text(
         formatted_message,
-        parse_mode='Markdown',
-        reply_markup=get_reply_keyboard()
+        reply_markup=REPLY_KEYBOARD
     )
 
 
@@ -1132,8 +1566,7 @@ async def ai_status_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not AI_TRAINING_ENABLED:
         await update.message.reply_text(
             "❌ AI Training platforms are not enabled. Set AI_TRAINING_ENABLED=true in .env",
-            parse_mode='Markdown',
-            reply_markup=get_reply_keyboard()
+            reply_markup=REPLY_KEYBOARD
         )
         return
     
@@ -1142,17 +1575,16 @@ async def ai_status_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         action='typing'
     )
     
-    success, data, error = check_ai_training_status()
+    success, data, error = await run_in_thread(check_ai_training_status)
     if success:
         parsed_data = parse_ai_training_status(data)
         formatted_message = format_ai_training_status(parsed_data)
     else:
-        formatted_message = f"❌ Error checking AI Training status:\n\n`{error}`"
+        formatted_message = f"❌ Error checking AI Training status:\n\n<code>{html.escape(error)}</code>"
     
     await update.message.reply_text(
         formatted_message,
-        parse_mode='Markdown',
-        reply_markup=get_reply_keyboard()
+        reply_markup=REPLY_KEYBOARD
     )
 
 
@@ -1162,84 +1594,165 @@ async def all_status_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
         chat_id=update.message.chat_id,
         action='typing'
     )
-    
-    formatted_message = "🌐 *All Platforms Status*\n\n"
-    
-    # GolemSP status
-    success, output, error = run_golemsp_status()
-    if success:
-        golem_data = parse_status_data(output)
-        golem_balance = golem_data.get('wallet', {}).get('total_glm', 0.0)
-        golem_tasks = golem_data.get('tasks', {}).get('in_progress', 0)
-        formatted_message += f"🚀 *GolemSP*\n"
-        formatted_message += f"• Balance: `{golem_balance:.6f} GLM`\n"
-        formatted_message += f"• Active Tasks: `{golem_tasks}`\n\n"
-    else:
-        formatted_message += f"🚀 *GolemSP*: ❌ Error\n\n"
-    
-    # Render Network status
-    if RENDER_NETWORK_ENABLED:
-        success, data, error = check_render_status()
-        if success:
-            render_data = parse_render_status(data)
-            render_earnings = render_data.get('total_earnings', 0.0)
-            render_jobs = render_data.get('active_jobs', 0)
-            formatted_message += f"🎨 *Render Network*\n"
-            formatted_message += f"• Earnings: `{render_earnings:.6f} RENDER`\n"
-            formatted_message += f"• Active Jobs: `{render_jobs}`\n\n"
-        else:
-            formatted_message += f"🎨 *Render Network*: ❌ Error\n\n"
-    else:
-        formatted_message += f"🎨 *Render Network*: ⚠️ Not enabled\n\n"
-    
-    # AI Training status
-    if AI_TRAINING_ENABLED:
-        success, data, error = check_ai_training_status()
-        if success:
-            ai_data = parse_ai_training_status(data)
-            ai_earnings = ai_data.get('total_earnings', 0.0)
-            ai_jobs = ai_data.get('active_jobs', 0)
-            formatted_message += f"🤖 *AI Training*\n"
-            formatted_message += f"• Earnings: `{ai_earnings:.6f}`\n"
-            formatted_message += f"• Active Jobs: `{ai_jobs}`\n\n"
-        else:
-            formatted_message += f"🤖 *AI Training*: ❌ Error\n\n"
-    else:
-        formatted_message += f"🤖 *AI Training*: ⚠️ Not enabled\n\n"
-    
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
-    formatted_message += f"🕒 Last updated: `{timestamp}`"
-    
+
+    formatted_message = await build_all_platforms_message()
+
     await update.message.reply_text(
         formatted_message,
-        parse_mode='Markdown',
-        reply_markup=get_reply_keyboard()
+        reply_markup=REPLY_KEYBOARD
+    )
+
+
+def request_monitoring_check(status_output):
+    """
+    Wake the monitoring loop if golemsp output changed since its last check.
+
+    Status requests from users often see a change before the next scheduled
+    check, so notifications go out without waiting for the interval.
+
+    Args:
+        status_output: Raw output of a successful golemsp status run
+    """
+    if monitoring_wake_event is not None and status_output != last_monitored_output:
+        monitoring_wake_event.set()
+
+
+def launch_monitoring_task(application, restarts=0):
+    """
+    Create the monitoring task and watch it for unexpected failures.
+
+    Args:
+        application: Telegram application passed to the monitoring loop
+        restarts: Number of times the loop has already been restarted
+    """
+    global monitoring_task, monitoring_restart_handle
+
+    monitoring_restart_handle = None
+    if monitoring_stop_event.is_set():
+        return
+
+    monitoring_task = asyncio.create_task(monitoring_loop(application), name='monitoring_loop')
+    monitoring_task.add_done_callback(
+        lambda task: on_monitoring_done(task, application, restarts)
+    )
+
+
+def on_monitoring_done(task, application, restarts):
+    """
+    Log a crashed monitoring task and relaunch it with exponential backoff.
+
+    Args:
+        task: Finished monitoring task
+        application: Telegram application passed to the monitoring loop
+        restarts: Number of times the loop had been restarted before this run
+    """
+    global monitoring_restart_handle
+
+    if task.cancelled() or monitoring_stop_event.is_set():
+        return
+
+    error = task.exception()
+    if error is None:
+        return
+
+    delay = min(2 ** restarts, MONITORING_INTERVAL)
+    logger.error(
+        f"Monitoring loop crashed, restarting in {delay}s",
+        exc_info=error
+    )
+    monitoring_restart_handle = asyncio.get_running_loop().call_later(
+        delay, launch_monitoring_task, application, restarts + 1
     )
 
 
 async def start_monitoring(application):
     """Start the background monitoring task."""
-    global monitoring_task
+    global monitoring_stop_event, monitoring_wake_event
 
     if MONITORING_ENABLED:
-        monitoring_task = asyncio.create_task(monitoring_loop(application))
+        monitoring_stop_event = asyncio.Event()
+        monitoring_wake_event = asyncio.Event()
+        launch_monitoring_task(application)
         logger.info("Background monitoring started")
     else:
         logger.info("Monitoring disabled via configuration")
 
 
+async def stop_monitoring():
+    """Ask the monitoring loop to stop and wait briefly for it to finish."""
+    if monitoring_stop_event is None:
+        return
+
+    # Also stops a crashed loop that is waiting to be relaunched
+    monitoring_stop_event.set()
+    monitoring_wake_event.set()
+    if monitoring_restart_handle is not None:
+        monitoring_restart_handle.cancel()
+
+    if monitoring_task is None or monitoring_task.done():
+        return
+    _, pending = await asyncio.wait([monitoring_task], timeout=10)
+    if pending:
+        monitoring_task.cancel()
+
+
+async def on_startup(application):
+    """Skip already handled updates and start background monitoring."""
+    # Allow operators to re-check the golemsp binary without a restart. The
+    # handler runs on the event loop, so it may log safely.
+    if hasattr(signal, 'SIGHUP'):
+        asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, clear_golemsp_caches)
+
+    await skip_handled_updates(application)
+    await start_monitoring(application)
+
+
+async def on_shutdown(application):
+    """Stop monitoring and persist any pending state before the bot exits."""
+    await stop_monitoring()
+    flush_registered_users()
+    flush_update_offset()
+
+
 def main():
     """Start the bot."""
+    global REPLY_KEYBOARD
+
+    setup_logging()
+
     if not BOT_TOKEN:
-        logger.error("BOT_TOKEN is not set. Please set it in .env file or environment variables.")
-        return
+        raise SystemExit("BOT_TOKEN environment variable is not set. Please set it in .env file or environment.")
 
     # Load registered users
     load_registered_users()
     logger.info(f"Loaded {len(registered_users)} registered users")
 
+    from telegram import KeyboardButton, ReplyKeyboardMarkup, Update
+    from telegram.constants import ParseMode
+    from telegram.ext import Application, CommandHandler, Defaults, MessageHandler, TypeHandler, filters
+    from telegram.request import HTTPXRequest
+
+    # Build the shared reply keyboard once
+    REPLY_KEYBOARD = ReplyKeyboardMarkup(
+        [[KeyboardButton(label) for label in row] for row in REPLY_KEYBOARD_LAYOUT],
+        resize_keyboard=True,
+        one_time_keyboard=False
+    )
+
     # Create application
-    application = Application.builder().token(BOT_TOKEN).build()
+    application = (
+        Application.builder()
+        .token(BOT_TOKEN)
+        .defaults(Defaults(parse_mode=ParseMode.HTML))
+        .concurrent_updates(32)  # A slow status check must not hold up other chats
+        # Enough connections for concurrent handlers plus notification fan-out;
+        # getUpdates keeps its own single long-polling connection
+        .request(HTTPXRequest(connection_pool_size=64, read_timeout=30, write_timeout=30))
+        .get_updates_request(HTTPXRequest(connection_pool_size=1, read_timeout=60))
+        .post_init(on_startup)
+        .post_shutdown(on_shutdown)
+        .build()
+    )
 
     # Register handlers
     application.add_handler(CommandHandler("start", start))
@@ -1253,22 +1766,20 @@ def main():
     # Handle keyboard button presses and other text messages
     application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_keyboard_button))
 
+    # Track the newest handled update id once the regular handlers are done
+    application.add_handler(TypeHandler(Update, record_update_offset), group=1)
+
     # Start the bot
     logger.info("Starting GolemSP Status Bot...")
-    import asyncio
-
-    # Check if there's already an event loop running
-    try:
-        loop = asyncio.get_running_loop()
-        # If we're here, there's already a running loop
-        logger.info("Detected running event loop, using alternative startup method")
-        # For now, let's try a simpler approach
-        import nest_asyncio
-        nest_asyncio.apply()
-        asyncio.run(application.run_polling())
-    except RuntimeError:
-        # No running loop, we can use asyncio.run()
-        asyncio.run(application.run_polling())
+    # Only plain messages (commands and keyboard buttons) are handled.
+    # Long polling keeps each getUpdates request open for up to 50 seconds
+    # instead of re-polling while idle.
+    application.run_polling(
+        timeout=50,
+        poll_interval=0,
+        bootstrap_retries=-1,
+        allowed_updates=["message"]
+    )
 
 
 if __name__ == '__main__':
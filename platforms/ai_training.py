@@ -2,15 +2,31 @@
 AI Training platforms (Together.ai, Akash Network) status checking and monitoring.
 """
 
+import html
 import os
-import subprocess
 import logging
 import json
 from datetime import datetime
 from typing import Tuple, Dict, Optional
 
+from .processes import find_process
+from .timestamps import format_timestamp
+
 logger = logging.getLogger(__name__)
 
+# Command-line fragments identifying an AI training worker process
+AI_TRAINING_SEARCH_TERMS = ('together', 'akash', 'ai-training', 'inference')
+
+# Platform flags are read once at import time
+TOGETHER_AI_ENABLED = os.getenv('TOGETHER_AI_ENABLED', 'false').lower() == 'true'
+AKASH_NODE_ENABLED = os.getenv('AKASH_NODE_ENABLED', 'false').lower() == 'true'
+
+# Platform keys in the status data and their display names
+AI_PLATFORM_NAMES = (('together_ai', 'Together.ai'), ('akash', 'Akash Network'))
+
+STATUS_EMOJI_RUNNING = "🟢"
+STATUS_EMOJI_STOPPED = "🔴"
+
 
 def find_ai_training_process() -> Optional[str]:
     """
@@ -19,22 +35,7 @@ def find_ai_training_process() -> Optional[str]:
     Returns:
         str or None: Process name or path if found
     """
-    search_terms = ['together', 'akash', 'ai-training', 'inference']
-    
-    for term in search_terms:
-        try:
-            result = subprocess.run(
-                ['pgrep', '-fl', term],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                return result.stdout.strip().split('\n')[0]
-        except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
-            logger.debug(f"Error finding AI training process with term '{term}': {e}")
-    
-    return None
+    return find_process(AI_TRAINING_SEARCH_TERMS)
 
 
 def check_ai_training_worker_running() -> bool:
@@ -56,21 +57,23 @@ def check_ai_training_status() -> Tuple[bool, Optional[Dict], Optional[str]]:
         tuple: (success: bool, data: dict or None, error: str or None)
     """
     try:
-        is_running = check_ai_training_worker_running()
+        # One process lookup serves both the running flag and the process name
+        process = find_ai_training_process()
+        is_running = process is not None
         
         data = {
             'timestamp': datetime.now().isoformat(),
             'worker': {
                 'status': 'running' if is_running else 'stopped',
-                'process': find_ai_training_process()
+                'process': process
             },
             'platforms': {
                 'together_ai': {
-                    'enabled': os.getenv('TOGETHER_AI_ENABLED', 'false').lower() == 'true',
+                    'enabled': TOGETHER_AI_ENABLED,
                     'status': 'running' if is_running else 'stopped'
                 },
                 'akash': {
-                    'enabled': os.getenv('AKASH_NODE_ENABLED', 'false').lower() == 'true',
+                    'enabled': AKASH_NODE_ENABLED,
                     'status': 'running' if is_running else 'stopped'
                 }
             },
@@ -107,27 +110,28 @@ def parse_ai_training_status(data: Dict) -> Dict:
     if not data:
         return {}
     
-    platforms = data.get('platforms', {})
-    together_enabled = platforms.get('together_ai', {}).get('enabled', False)
-    akash_enabled = platforms.get('akash', {}).get('enabled', False)
-    
-    active_platforms = []
-    if together_enabled:
-        active_platforms.append('Together.ai')
-    if akash_enabled:
-        active_platforms.append('Akash Network')
+    worker = data.get('worker') or {}
+    jobs = data.get('jobs') or {}
+    earnings = data.get('earnings') or {}
+    platforms = data.get('platforms') or {}
+    enabled = {
+        key: (platforms.get(key) or {}).get('enabled', False)
+        for key, _ in AI_PLATFORM_NAMES
+    }
+    active_platforms = [name for key, name in AI_PLATFORM_NAMES if enabled[key]]
+    worker_status = worker.get('status', 'unknown')
     
     parsed = {
-        'worker_status': data.get('worker', {}).get('status', 'unknown'),
-        'is_running': data.get('worker', {}).get('status') == 'running',
+        'worker_status': worker_status,
+        'is_running': worker_status == 'running',
         'active_platforms': active_platforms,
-        'together_ai_enabled': together_enabled,
-        'akash_enabled': akash_enabled,
-        'active_jobs': data.get('jobs', {}).get('active', 0),
-        'completed_jobs': data.get('jobs', {}).get('completed', 0),
-        'total_earnings': data.get('earnings', {}).get('total', 0.0),
-        'pending_earnings': data.get('earnings', {}).get('pending', 0.0),
-        'timestamp': data.get('timestamp', datetime.now().isoformat())
+        # together_ai_enabled, akash_enabled, ...
+        **{f'{key}_enabled': is_enabled for key, is_enabled in enabled.items()},
+        'active_jobs': jobs.get('active', 0),
+        'completed_jobs': jobs.get('completed', 0),
+        'total_earnings': earnings.get('total', 0.0),
+        'pending_earnings': earnings.get('pending', 0.0),
+        'timestamp': data.get('timestamp') or datetime.now().isoformat()
     }
     
     return parsed
@@ -146,45 +150,39 @@ def format_ai_training_status(data: Dict) -> str:
     if not data:
         return "❌ No AI training platform status available."
     
-    message_parts = []
-    message_parts.append("🤖 *AI Training Platform Status*\n")
-    
     worker_status = data.get('worker_status', 'unknown')
-    status_emoji = "🟢" if data.get('is_running', False) else "🔴"
-    message_parts.append(f"• Worker Status: {status_emoji} {worker_status.capitalize()}")
+    status_emoji = STATUS_EMOJI_RUNNING if data.get('is_running', False) else STATUS_EMOJI_STOPPED
     
     active_platforms = data.get('active_platforms', [])
-    if active_platforms:
-        platforms_str = ', '.join(active_platforms)
-        message_parts.append(f"• Active Platforms: `{platforms_str}`")
-    else:
-        message_parts.append("• Active Platforms: `None configured`")
-    
-    together_enabled = data.get('together_ai_enabled', False)
-    akash_enabled = data.get('akash_enabled', False)
-    if together_enabled:
-        message_parts.append(f"• Together.ai: {'🟢 Enabled' if data.get('is_running') else '🔴 Disabled'}")
-    if akash_enabled:
-        message_parts.append(f"• Akash Network: {'🟢 Enabled' if data.get('is_running') else '🔴 Disabled'}")
-    
-    active_jobs = data.get('active_jobs', 0)
-    completed_jobs = data.get('completed_jobs', 0)
-    message_parts.append(f"• Active Jobs: `{active_jobs}`")
-    message_parts.append(f"• Completed Jobs: `{completed_jobs}`")
+    platforms_str = html.escape(', '.join(active_platforms)) if active_platforms else 'None configured'
+    
+    platform_state = (
+        f"{STATUS_EMOJI_RUNNING} Enabled" if data.get('is_running')
+        else f"{STATUS_EMOJI_STOPPED} Disabled"
+    )
+    platform_lines = ''.join(
+        f"• {name}: {platform_state}\n"
+        for key, name in AI_PLATFORM_NAMES
+        if data.get(f'{key}_enabled', False)
+    )
     
-    total_earnings = data.get('total_earnings', 0.0)
     pending_earnings = data.get('pending_earnings', 0.0)
-    message_parts.append(f"• Total Earnings: `{total_earnings:.6f}`")
-    if pending_earnings > 0:
-        message_parts.append(f"• Pending Earnings: `{pending_earnings:.6f}`")
-    
-    timestamp = data.get('timestamp', datetime.now().isoformat())
-    try:
-        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-        formatted_time = dt.strftime("%Y-%m-%d %H:%M:%S UTC")
-    except:
-        formatted_time = timestamp
-    message_parts.append(f"\n🕒 Last updated: `{formatted_time}`")
-    
-    return '\n'.join(message_parts)
+    pending_line = (
+        f"• Pending Earnings: <code>{pending_earnings:.6f}</code>\n"
+        if pending_earnings > 0 else ''
+    )
+    
+    formatted_time = format_timestamp(data.get('timestamp') or datetime.now().isoformat())
+    
+    return (
+        "🤖 <b>AI Training Platform Status</b>\n\n"
+        f"• Worker Status: {status_emoji} {worker_status.capitalize()}\n"
+        f"• Active Platforms: <code>{platforms_str}</code>\n"
+        f"{platform_lines}"
+        f"• Active Jobs: <code>{data.get('active_jobs', 0)}</code>\n"
+        f"• Completed Jobs: <code>{data.get('completed_jobs', 0)}</code>\n"
+        f"• Total Earnings: <code>{data.get('total_earnings', 0.0):.6f}</code>\n"
+        f"{pending_line}"
+        f"\n🕒 Last updated: <code>{formatted_time}</code>"
+    )
 
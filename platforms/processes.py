@@ -0,0 +1,98 @@
+"""
+Process lookup shared by the platform status checks.
+"""
+
+import os
+import subprocess
+import logging
+import time
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+PROC_DIR = '/proc'
+
+# How long a process lookup result is reused (seconds)
+PROC_LOOKUP_TTL = float(os.getenv('PROC_LOOKUP_TTL', '2'))
+
+# Recent lookups: search terms -> (time.monotonic() of lookup, result)
+_lookup_cache = {}
+
+
+def scan_proc(terms: Iterable[str]) -> Optional[str]:
+    """
+    Find a process whose command line contains any of the given terms.
+
+    Reads /proc/<pid>/cmdline directly instead of spawning pgrep.
+
+    Args:
+        terms: Command-line fragments to look for
+
+    Returns:
+        str or None: "<pid> <command line>" of the lowest matching PID
+    """
+    patterns = tuple(term.encode() for term in terms)
+    own_pid = os.getpid()
+
+    pids = sorted(int(name) for name in os.listdir(PROC_DIR) if name.isdigit())
+    for pid in pids:
+        if pid == own_pid:
+            continue
+        try:
+            with open(f'{PROC_DIR}/{pid}/cmdline', 'rb') as f:
+                cmdline = f.read()
+        except OSError:
+            # Process exited or is not readable
+            continue
+        if any(pattern in cmdline for pattern in patterns):
+            command = cmdline.rstrip(b'\0').replace(b'\0', b' ').decode(errors='replace')
+            return f"{pid} {command}"
+
+    return None
+
+
+def find_process(terms: Iterable[str]) -> Optional[str]:
+    """
+    Find a running process by command-line fragments.
+
+    Uses the /proc scan where available and falls back to a single pgrep call
+    on systems without /proc. Results are reused for PROC_LOOKUP_TTL seconds.
+
+    Args:
+        terms: Command-line fragments to look for
+
+    Returns:
+        str or None: Description of the first matching process, if any
+    """
+    terms = tuple(terms)
+
+    now = time.monotonic()
+    cached = _lookup_cache.get(terms)
+    if cached is not None and now - cached[0] < PROC_LOOKUP_TTL:
+        return cached[1]
+
+    result = _find_process_uncached(terms)
+    _lookup_cache[terms] = (now, result)
+    return result
+
+
+def _find_process_uncached(terms):
+    """Look up a process by command-line fragments without the cache."""
+    if os.path.isdir(PROC_DIR):
+        return scan_proc(terms)
+
+    # pgrep patterns are extended regexes, so one call covers every term
+    pattern = '|'.join(terms)
+    try:
+        result = subprocess.run(
+            ['pgrep', '-fl', pattern],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip().partition('\n')[0]
+    except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
+        logger.debug(f"Error finding process with pattern '{pattern}': {e}")
+
+    return None
@@ -3,14 +3,19 @@ Render Network status checking and monitoring.
 """
 
 import os
-import subprocess
 import logging
 import json
 from datetime import datetime
 from typing import Tuple, Dict, Optional
 
+from .processes import find_process
+from .timestamps import format_timestamp
+
 logger = logging.getLogger(__name__)
 
+STATUS_EMOJI_RUNNING = "🟢"
+STATUS_EMOJI_STOPPED = "🔴"
+
 
 def find_render_worker_process() -> Optional[str]:
     """
@@ -19,19 +24,7 @@ def find_render_worker_process() -> Optional[str]:
     Returns:
         str or None: Process name or path if found
     """
-    try:
-        result = subprocess.run(
-            ['pgrep', '-fl', 'render'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip().split('\n')[0]
-    except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
-        logger.debug(f"Error finding render process: {e}")
-    
-    return None
+    return find_process(('render',))
 
 
 def check_render_worker_running() -> bool:
@@ -53,13 +46,15 @@ def check_render_status() -> Tuple[bool, Optional[Dict], Optional[str]]:
         tuple: (success: bool, data: dict or None, error: str or None)
     """
     try:
-        is_running = check_render_worker_running()
+        # One process lookup serves both the running flag and the process name
+        process = find_render_worker_process()
+        is_running = process is not None
         
         data = {
             'timestamp': datetime.now().isoformat(),
             'worker': {
                 'status': 'running' if is_running else 'stopped',
-                'process': find_render_worker_process()
+                'process': process
             },
             'jobs': {
                 'active': 0,
@@ -94,14 +89,19 @@ def parse_render_status(data: Dict) -> Dict:
     if not data:
         return {}
     
+    worker = data.get('worker') or {}
+    jobs = data.get('jobs') or {}
+    earnings = data.get('earnings') or {}
+    worker_status = worker.get('status', 'unknown')
+    
     parsed = {
-        'worker_status': data.get('worker', {}).get('status', 'unknown'),
-        'is_running': data.get('worker', {}).get('status') == 'running',
-        'active_jobs': data.get('jobs', {}).get('active', 0),
-        'completed_jobs': data.get('jobs', {}).get('completed', 0),
-        'total_earnings': data.get('earnings', {}).get('total', 0.0),
-        'pending_earnings': data.get('earnings', {}).get('pending', 0.0),
-        'timestamp': data.get('timestamp', datetime.now().isoformat())
+        'worker_status': worker_status,
+        'is_running': worker_status == 'running',
+        'active_jobs': jobs.get('active', 0),
+        'completed_jobs': jobs.get('completed', 0),
+        'total_earnings': earnings.get('total', 0.0),
+        'pending_earnings': earnings.get('pending', 0.0),
+        'timestamp': data.get('timestamp') or datetime.now().isoformat()
     }
     
     return parsed
@@ -120,31 +120,23 @@ def format_render_status(data: Dict) -> str:
     if not data:
         return "❌ No Render Network status available."
     
-    message_parts = []
-    message_parts.append("🎨 *Render Network Status*\n")
-    
     worker_status = data.get('worker_status', 'unknown')
-    status_emoji = "🟢" if data.get('is_running', False) else "🔴"
-    message_parts.append(f"• Worker Status: {status_emoji} {worker_status.capitalize()}")
-    
-    active_jobs = data.get('active_jobs', 0)
-    completed_jobs = data.get('completed_jobs', 0)
-    message_parts.append(f"• Active Jobs: `{active_jobs}`")
-    message_parts.append(f"• Completed Jobs: `{completed_jobs}`")
-    
-    total_earnings = data.get('total_earnings', 0.0)
+    status_emoji = STATUS_EMOJI_RUNNING if data.get('is_running', False) else STATUS_EMOJI_STOPPED
     pending_earnings = data.get('pending_earnings', 0.0)
-    message_parts.append(f"• Total Earnings: `{total_earnings:.6f} RENDER`")
-    if pending_earnings > 0:
-        message_parts.append(f"• Pending Earnings: `{pending_earnings:.6f} RENDER`")
+    pending_line = (
+        f"• Pending Earnings: <code>{pending_earnings:.6f} RENDER</code>\n"
+        if pending_earnings > 0 else ''
+    )
     
-    timestamp = data.get('timestamp', datetime.now().isoformat())
-    try:
-        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-        formatted_time = dt.strftime("%Y-%m-%d %H:%M:%S UTC")
-    except:
-        formatted_time = timestamp
-    message_parts.append(f"\n🕒 Last updated: `{formatted_time}`")
+    formatted_time = format_timestamp(data.get('timestamp') or datetime.now().isoformat())
     
-    return '\n'.join(message_parts)
+    return (
+        "🎨 <b>Render Network Status</b>\n\n"
+        f"• Worker Status: {status_emoji} {worker_status.capitalize()}\n"
+        f"• Active Jobs: <code>{data.get('active_jobs', 0)}</code>\n"
+        f"• Completed Jobs: <code>{data.get('completed_jobs', 0)}</code>\n"
+        f"• Total Earnings: <code>{data.get('total_earnings', 0.0):.6f} RENDER</code>\n"
+        f"{pending_line}"
+        f"\n🕒 Last updated: <code>{formatted_time}</code>"
+    )
 
@@ -0,0 +1,23 @@
+"""
+Timestamp formatting shared by the platform status formatters.
+"""
+
+from datetime import datetime
+
+
+def format_timestamp(timestamp: str) -> str:
+    """
+    Format an ISO 8601 timestamp for display.
+    
+    Args:
+        timestamp: ISO 8601 timestamp, optionally ending in 'Z'
+        
+    Returns:
+        str: Timestamp as "YYYY-MM-DD HH:MM:SS UTC", or the input unchanged
+        if it cannot be parsed
+    """
+    try:
+        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except (ValueError, AttributeError):
+        return timestamp
+    return dt.strftime("%Y-%m-%d %H:%M:%S UTC")
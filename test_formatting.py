@@ -4,31 +4,10 @@ Test script for the new formatting functions.
 """
 
 import sys
-
-# Mock the telegram imports to avoid dependency issues
-import types
-telegram_mock = types.ModuleType('telegram')
-telegram_mock.Update = object
-telegram_mock.ReplyKeyboardMarkup = object
-telegram_mock.KeyboardButton = object
-sys.modules['telegram'] = telegram_mock
-
-telegram_ext_mock = types.ModuleType('telegram.ext')
-telegram_ext_mock.Application = object
-telegram_ext_mock.CommandHandler = object
-telegram_ext_mock.MessageHandler = object
-telegram_ext_mock.filters = types.ModuleType('filters')
-telegram_ext_mock.filters.TEXT = object
-telegram_ext_mock.filters.COMMAND = object
-telegram_ext_mock.ContextTypes = types.ModuleType('ContextTypes')
-telegram_ext_mock.ContextTypes.DEFAULT_TYPE = object
-sys.modules['telegram.ext'] = telegram_ext_mock
-
-# Now import our functions
-from bot import format_status_section, format_wallet_section, format_tasks_section
+from unittest.mock import MagicMock
 
 # Test with the status output from the message
-test_output = '''┌────────────────────────────────────────────────┐
+TEST_OUTPUT = '''┌────────────────────────────────────────────────┐
 │  Status                                      │
 │                                                │
 │  Service    is running                       │
@@ -62,16 +41,79 @@ test_output = '''┌────────────────────
 │  (including failures)                          │
 └────────────────────────────────────────────────┘'''
 
-print('=== SERVICE STATUS ===')
-result1 = format_status_section(test_output)
-print(result1)
-print()
-print('=== WALLET INFO ===')
-result2 = format_wallet_section(test_output)
-print(result2)
-print()
-print('=== TASK STATISTICS ===')
-result3 = format_tasks_section(test_output)
-print(result3)
-print()
-print('✅ All formatting functions work correctly!')
+
+# What parse_status_data should extract from TEST_OUTPUT: one value (or more)
+# for every key in GOLEM_STATUS_FIELDS, plus the wallet address. Matches the
+# output of the line-based parser it replaced.
+EXPECTED_STATUS_DATA = {
+    'service': {
+        'status': 'running',
+        'version': '0.17.6',
+        'node_name': 'tan-territory',
+        'subnet': 'public',
+        'vm': 'invalid environment',
+    },
+    'wallet': {
+        'address': '0x34874a4904cad46fab709b57fabef0589a0fd075',
+        'network': 'mainnet',
+        'total': '0 GLM',
+        'total_glm': 0.0,
+        'pending': '0 GLM (0)',
+        'pending_glm': 0.0,
+    },
+    'tasks': {
+        'last_hour_processed': 0,
+        'in_progress': 0,
+        'total_processed': 0,
+    },
+}
+
+
+def check_parsed(status_data, label):
+    """Assert that parsed status data matches EXPECTED_STATUS_DATA."""
+    parsed = {key: value for key, value in status_data.items() if key != 'timestamp'}
+    assert parsed == EXPECTED_STATUS_DATA, f"{label}: unexpected parse result {parsed}"
+    print(f'✅ Parser output matches for {label}')
+
+
+def main():
+    """Run the formatters against TEST_OUTPUT and print the results."""
+    # Mock the telegram imports to avoid dependency issues
+    sys.modules['telegram'] = MagicMock()
+    sys.modules['telegram.ext'] = MagicMock()
+    sys.modules['telegram.ext.filters'] = MagicMock()
+
+    # Now import our functions
+    from bot import (
+        GOLEM_STATUS_FIELDS, decode_output, parse_status_data,
+        format_status_section, format_wallet_section, format_tasks_section,
+    )
+
+    status_data = parse_status_data(TEST_OUTPUT)
+
+    print('=== PARSER ===')
+    missing = [key for key in GOLEM_STATUS_FIELDS if key not in TEST_OUTPUT]
+    assert not missing, f"TEST_OUTPUT lacks fields: {missing}"
+    check_parsed(status_data, 'LF output')
+    # golemsp output arrives as bytes and goes through decode_output first
+    crlf_output = TEST_OUTPUT.replace('\n', '\r\n').encode()
+    check_parsed(parse_status_data(decode_output(crlf_output)), 'CRLF output')
+    print()
+
+    print('=== SERVICE STATUS ===')
+    result1 = format_status_section(status_data)
+    print(result1)
+    print()
+    print('=== WALLET INFO ===')
+    result2 = format_wallet_section(status_data)
+    print(result2)
+    print()
+    print('=== TASK STATISTICS ===')
+    result3 = format_tasks_section(status_data)
+    print(result3)
+    print()
+    print('✅ All formatting functions work correctly!')
+
+
+if __name__ == '__main__':
+    main()